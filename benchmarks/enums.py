@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the enumerations.
+
+Run from the root of the repository with `python -m benchmarks.enums`.
+"""
+
+import gc
+import operator
+import pickle
+import timeit
+import tracemalloc
+from enum import Enum
+
+from echoices.enums import EChoice, EChoiceMeta, EOrderedChoice
+
+
+def make_members(size):
+    return [('FIELD{}'.format(i), ('value{}'.format(i), 'Label {}'.format(i))) for i in range(size)]
+
+
+def make_echoice(name, members, **kwargs):
+    """Equivalent to a class statement, which supports the keywords of the metaclass unlike the functional API."""
+    bases = (EChoice,)
+    classdict = EChoiceMeta.__prepare__(name, bases, **kwargs)
+    for member_name, args in members:
+        classdict[member_name] = args
+    return EChoiceMeta(name, bases, classdict, **kwargs)
+
+
+def bench_construction(sizes=(1000, 10000, 100000), repeat=3):
+    """Construction time of an EChoice, which is expected to scale linearly with the number of members."""
+    print("EChoice construction")
+    for size in sizes:
+        members = make_members(size)
+        best = min(timeit.repeat(lambda: EChoice('EBenchChoices', members), number=1, repeat=repeat))
+        print("  {:>7} members: {:8.3f} s, {:6.2f} us/member".format(size, best, best / size * 1e6))
+
+
+class EBenchIntChoices(EOrderedChoice):
+    FIELD1 = (10, 'Label 1')
+    FIELD2 = (20, 'Label 2')
+    FIELD3 = (30, 'Label 3')
+
+
+def bench_comparisons(number=1000000):
+    """Comparison operators of a member against the various kinds of operands."""
+    print("EChoice comparisons ({} loops)".format(number))
+    operands = [
+        ('member', 'other'),
+        ('value', '30'),
+        ('str', "'30'"),
+        ('float', '30.0'),
+        ('None', 'None'),
+    ]
+    setup = 'member, other = EBenchIntChoices.FIELD2, EBenchIntChoices.FIELD3'
+    for op in ['==', '!=', '<', '<=', '>', '>=']:
+        for name, operand in operands:
+            stmt = 'member {} {}'.format(op, operand)
+            if name == 'None' and op not in ['==', '!=']:
+                # Not supported
+                continue
+            best = min(timeit.repeat(stmt, setup=setup, number=number, repeat=3, globals=globals()))
+            print("  member {:<2} {:<6}: {:6.3f} us".format(op, name, best / number * 1e6))
+
+
+def bench_decoding(size=1000000, repeat=3):
+    """Decoding of a column of raw values, one by one compared to `decode_many()`."""
+    print("EChoice decoding ({} values)".format(size))
+    values = [(10, 20, 30, None)[i % 4] for i in range(size)]
+
+    def one_by_one():
+        return [None if v is None else EBenchIntChoices[v] for v in values]
+
+    for name, func in [('one by one', one_by_one), ('decode_many', lambda: EBenchIntChoices.decode_many(values))]:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print("  {:<11}: {:6.3f} s".format(name, best))
+
+
+def bench_sorting(size=100000, repeat=3):
+    """Sorting of objects by an EOrderedChoice attribute, comparing the elements or with `sort_key()`."""
+    print("EOrderedChoice sorting ({} objects)".format(size))
+
+    class Obj:
+        __slots__ = ('choice',)
+
+        def __init__(self, choice):
+            self.choice = choice
+
+    objects = [Obj(list(EBenchIntChoices)[(i * 7) % 3]) for i in range(size)]
+    for name, key in [('compare', operator.attrgetter('choice')),
+                      ('sort_key', EBenchIntChoices.sort_key('sorted', 'choice')),
+                      ('not null', EBenchIntChoices.sort_key('sorted', 'choice', nullable=False))]:
+        best = min(timeit.repeat(lambda: sorted(objects, key=key), number=1, repeat=repeat))
+        print("  {:<8}: {:6.3f} s".format(name, best))
+
+
+class EBenchPlainChoices(Enum):
+    """Baseline of the pickling, a plain Enum with the same members as `EBenchIntChoices`."""
+    FIELD1 = (10, 'Label 1')
+    FIELD2 = (20, 'Label 2')
+    FIELD3 = (30, 'Label 3')
+
+
+def bench_pickling(size=1000000, single=100000, repeat=3):
+    """Pickling of a list of members, and of members pickled one by one, compared to a plain Enum."""
+    print("EChoice pickling ({} members in a list, {} one by one)".format(size, single))
+    for echoice in [EBenchPlainChoices, EBenchIntChoices]:
+        members = [list(echoice)[i % 3] for i in range(size)]
+        dumped = pickle.dumps(members, pickle.HIGHEST_PROTOCOL)
+        loads = min(timeit.repeat(lambda: pickle.loads(dumped), number=1, repeat=repeat))
+        one_by_one = [pickle.dumps(m, pickle.HIGHEST_PROTOCOL) for m in members[:single]]
+        loads_one_by_one = min(timeit.repeat(lambda: [pickle.loads(d) for d in one_by_one], number=1, repeat=repeat))
+        print("  {:<18}: list {:7.1f} KiB, loaded in {:6.3f} s; one by one {:3d} B, loaded in {:6.3f} s".format(
+            echoice.__name__, len(dumped) / 2 ** 10, loads, len(one_by_one[0]), loads_one_by_one))
+
+
+def bench_memory(sizes=(10000, 100000)):
+    """Memory allocated by the creation of an EChoice, with the default and the compact layouts."""
+    print("EChoice memory")
+    for size in sizes:
+        members = make_members(size)
+        for compact in [False, True]:
+            gc.collect()
+            tracemalloc.start()
+            echoice = make_echoice('EBenchChoices', members, compact=compact)
+            gc.collect()
+            allocated = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            assert echoice.__compact__ is compact
+            print("  {:>7} members, {:<7}: {:7.2f} MiB, {:5.0f} B/member".format(
+                size, 'compact' if compact else 'default', allocated / 2 ** 20, allocated / size))
+            del echoice
+
+
+if __name__ == '__main__':
+    bench_construction()
+    bench_comparisons()
+    bench_decoding()
+    bench_sorting()
+    bench_pickling()
+    bench_memory()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the model fields.
+
+Run from the root of the repository with `python -m benchmarks.fields`.
+"""
+
+import timeit
+
+import django
+from django.conf import settings
+
+settings.configure(USE_I18N=False)
+django.setup()
+
+from django.db import models  # noqa: E402
+
+from echoices.enums import EChoice  # noqa: E402
+from echoices.fields import make_echoicefield  # noqa: E402
+
+
+def make_echoice(size):
+    return EChoice('EBenchChoices', [('FIELD{}'.format(i), ('value{}'.format(i), 'Label {}'.format(i)))
+                                     for i in range(size)])
+
+
+def bench_clean(sizes=(3, 100), number=1000000, repeat=3):
+    """Validation of the values of a field, as done by `full_clean()`, compared to a `models.CharField` with choices."""
+    print("Field cleaning ({} values)".format(number))
+    for size in sizes:
+        echoice = make_echoice(size)
+        members = list(echoice)
+        field = make_echoicefield(echoice)
+        char_field = models.CharField(max_length=echoice.max_value_length(), choices=echoice.choices())
+        for name, f, values in [('CharField', char_field, [m.value for m in members]),
+                                ('EChoiceField', field, members)]:
+            values = [values[i % size] for i in range(number)]
+
+            def clean():
+                for v in values:
+                    f.clean(v, None)
+
+            best = min(timeit.repeat(clean, number=1, repeat=repeat))
+            print("  {:>5} members, {:<12}: {:6.3f} s".format(size, name, best))
+
+
+if __name__ == '__main__':
+    bench_clean()
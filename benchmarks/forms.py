@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the form fields.
+
+Run from the root of the repository with `python -m benchmarks.forms`.
+"""
+
+import timeit
+
+import django
+from django.conf import settings
+
+settings.configure(USE_I18N=False)
+django.setup()
+
+from django import forms  # noqa: E402
+
+from echoices.enums import EChoice  # noqa: E402
+from echoices.fields import make_echoicefield  # noqa: E402
+
+
+def make_echoice(size):
+    return EChoice('EBenchChoices', [('FIELD{}'.format(i), ('value{}'.format(i), 'Label {}'.format(i)))
+                                     for i in range(size)])
+
+
+def bench_formset(sizes=(100, 3000), rows=200, repeat=3):
+    """Construction of a formset, with a field for the choices of an enum, compared to the same choices as a list."""
+    print("Formset construction ({} forms)".format(rows))
+    for size in sizes:
+        echoice = make_echoice(size)
+        field = make_echoicefield(echoice).formfield()
+
+        class EChoiceForm(forms.Form):
+            choice = field
+
+        class ListForm(forms.Form):
+            choice = forms.TypedChoiceField(choices=list(field.choices))
+
+        for name, form in [('list', ListForm), ('TypedEChoiceField', EChoiceForm)]:
+            formset_class = forms.formset_factory(form, extra=rows)
+            best = min(timeit.repeat(lambda: formset_class().forms, number=1, repeat=repeat))
+            print("  {:>5} members, {:<17}: {:7.2f} ms".format(size, name, best * 1e3))
+
+
+if __name__ == '__main__':
+    bench_formset()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the serialization of the enumerations.
+
+Run from the root of the repository with `python -m benchmarks.serializers`.
+"""
+
+import json
+import timeit
+
+from echoices.enums import EChoice
+from echoices.serializers import EChoiceJSONEncoder, decode_objects, echoice_default, echoice_object_hook
+
+
+class EBenchStates(EChoice):
+    CREATED = ('c', 'Created')
+    SUBMITTED = ('s', 'Submitted')
+    ACCEPTED = ('a', 'Accepted')
+
+
+def make_payload(size):
+    states = list(EBenchStates)
+    return [{'id': i, 'state': states[i % 3]} for i in range(size)]
+
+
+def bench_json_encoding(size=100000, repeat=3):
+    """Encoding of a payload of objects holding a member, converted manually beforehand or by the encoders."""
+    print("EChoice JSON encoding ({} objects)".format(size))
+    payload = make_payload(size)
+
+    def manual():
+        return json.dumps([{'id': o['id'], 'state': o['state'].value} for o in payload])
+
+    for name, func in [('manual', manual),
+                       ('default=', lambda: json.dumps(payload, default=echoice_default)),
+                       ('cls=', lambda: json.dumps(payload, cls=EChoiceJSONEncoder))]:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print("  {:<8}: {:6.3f} s".format(name, best))
+
+
+def bench_json_decoding(size=100000, repeat=3):
+    """Decoding of a payload of objects holding a value, converted manually afterwards or by the helpers."""
+    print("EChoice JSON decoding ({} objects)".format(size))
+    dumped = json.dumps(make_payload(size), default=echoice_default)
+
+    def manual():
+        payload = json.loads(dumped)
+        for o in payload:
+            o['state'] = EBenchStates[o['state']]
+        return payload
+
+    for name, func in [('manual', manual),
+                       ('object_hook', lambda: json.loads(dumped, object_hook=echoice_object_hook(state=EBenchStates))),
+                       ('decode_objects', lambda: decode_objects(json.loads(dumped), state=EBenchStates))]:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print("  {:<14}: {:6.3f} s".format(name, best))
+
+
+if __name__ == '__main__':
+    bench_json_encoding()
+    bench_json_decoding()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the enumerations shared between processes.
+
+Run from the root of the repository with `python -m benchmarks.shared`.
+"""
+
+import multiprocessing
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.conf import settings
+
+settings.configure(USE_I18N=False)
+django.setup()
+
+from echoices.enums import EChoice, EChoiceMeta, SharedEChoice  # noqa: E402
+
+
+def make_echoice(size):
+    """Stands for a large enumeration generated at import."""
+    bases = (EChoice,)
+    classdict = EChoiceMeta.__prepare__('EBenchChoices', bases, compact=True)
+    for i in range(size):
+        classdict['FIELD{}'.format(i)] = ('value{}'.format(i), 'Label {}'.format(i))
+    return EChoiceMeta('EBenchChoices', bases, classdict, compact=True)
+
+
+def get_rss():
+    """Resident memory of the current process, in MiB. `ru_maxrss` is not used, as it is kept through `exec()`."""
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * resource.getpagesize() / 2 ** 20
+
+
+def init_worker(barrier):
+    global worker_barrier
+    worker_barrier = barrier
+
+
+def run_worker(mode, size, shared):
+    # Hold each task until all the workers are started, so that each worker runs exactly one task
+    worker_barrier.wait()
+    rss = get_rss()
+    # CPU time, as the workers may outnumber the cores
+    start = time.process_time()
+    if mode == 'generated':
+        label = make_echoice(size)['value1'].label
+    elif mode == 'shared echoice':
+        label = shared.echoice['value1'].label
+    else:
+        label = shared.label('value1')
+    assert label == 'Label 1'
+    return time.process_time() - start, get_rss() - rss
+
+
+def bench_workers(size=200000, workers=8):
+    """Boot of workers requiring a large enumeration, generated by each of them, or shared by their parent."""
+    print("Workers boot ({} workers, {} members)".format(workers, size))
+    # Spawned workers import everything again, as the workers of a pool usually do
+    context = multiprocessing.get_context('spawn')
+    start = time.process_time()
+    shared = SharedEChoice.create(make_echoice(size))
+    print("  {:<16}: {:8.3f} s".format('shared by parent', time.process_time() - start))
+    try:
+        for mode in ['generated', 'shared echoice', 'shared label']:
+            barrier = context.Barrier(workers)
+            with ProcessPoolExecutor(workers, mp_context=context, initializer=init_worker,
+                                     initargs=(barrier,)) as executor:
+                results = list(executor.map(run_worker, [mode] * workers, [size] * workers, [shared] * workers))
+            times, rss = zip(*results)
+            print("  {:<16}: {:8.3f} s, {:7.1f} MiB per worker".format(
+                mode, sum(times) / workers, sum(rss) / workers))
+    finally:
+        shared.unlink()
+
+
+if __name__ == '__main__':
+    bench_workers()
@@ -0,0 +1 @@
+from .filters import EChoiceListFilter
@@ -0,0 +1,97 @@
+import hashlib
+
+from django.contrib.admin.filters import ChoicesFieldListFilter
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Count
+from django.utils.encoding import force_str
+from django.utils.translation import ugettext_lazy as _
+
+
+class EChoiceListFilter(ChoicesFieldListFilter):
+    """
+    Admin list filter for an `EChoiceField`, displaying the number of objects of each member.
+
+    All the numbers are computed with a single query, grouping the objects by the value of the field, then kept in the
+    cache for `cache_timeout` seconds. The members without any object are listed as well.
+
+    Used as `list_filter = [('my_field', EChoiceListFilter)]` in a `ModelAdmin`.
+
+    Attributes
+    ----------
+    cache_alias : str
+        Of the cache in which the numbers are kept.
+    cache_timeout : int or None
+        In seconds, as expected by the cache framework.
+
+    """
+    cache_alias = 'default'
+    cache_timeout = 60
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        super(EChoiceListFilter, self).__init__(field, request, params, model, model_admin, field_path)
+        self.empty_value_display = model_admin.get_empty_value_display()
+
+    def queryset(self, request, queryset):
+        if self.lookup_val is not None:
+            member = self.field.echoices.get(self.lookup_val)
+            if member is None:
+                raise IncorrectLookupParameters("Invalid choice: {}".format(self.lookup_val))
+            self.used_parameters[self.lookup_kwarg] = member
+        return super(EChoiceListFilter, self).queryset(request, queryset)
+
+    def get_counts(self, queryset):
+        """
+        Return the number of objects of each member in the queryset, and of those without any member.
+
+        Parameters
+        ----------
+        queryset : QuerySet
+            Of the model of this filter.
+
+        Returns
+        -------
+        dict
+            Mapping each value of the field, and None, to its number of objects.
+
+        """
+        try:
+            sql = str(queryset.query)
+        except EmptyResultSet:
+            # E.g. `queryset.none()`, which does not match any object, nor compiles to SQL
+            sql = None
+        cache = caches[self.cache_alias]
+        key = 'echoices.listfilter.{}'.format(
+            hashlib.md5(force_str('{}:{}'.format(self.field_path, sql)).encode()).hexdigest())
+        counts = cache.get(key) if sql is not None else None
+        if counts is None:
+            counts = dict.fromkeys(self.field.echoices.values(), 0)
+            counts[None] = 0
+            if sql is not None:
+                rows = queryset.order_by().values_list(self.field_path).annotate(count=Count('*'))
+                for member, count in rows:
+                    counts[member.value if member is not None else None] = count
+                cache.set(key, counts, self.cache_timeout)
+        return counts
+
+    def choices(self, changelist):
+        counts = self.get_counts(changelist.root_queryset)
+        yield {
+            'selected': self.lookup_val is None and not self.lookup_val_isnull,
+            'query_string': changelist.get_query_string(remove=[self.lookup_kwarg, self.lookup_kwarg_isnull]),
+            'display': _('All'),
+        }
+        for member, label in self.field.flatchoices:
+            yield {
+                'selected': self.lookup_val is not None and self.field.echoices.get(self.lookup_val) is member,
+                'query_string': changelist.get_query_string({self.lookup_kwarg: member.value},
+                                                            [self.lookup_kwarg_isnull]),
+                'display': '{} ({})'.format(label, counts[member.value]),
+            }
+        if self.field.null:
+            yield {
+                'selected': bool(self.lookup_val_isnull),
+                'query_string': changelist.get_query_string({self.lookup_kwarg_isnull: 'True'}, [self.lookup_kwarg]),
+                'display': '{} ({})'.format(self.empty_value_display, counts[None]),
+            }
@@ -1,2 +1,3 @@
 from .enums import EChoiceMeta
 from .enums import EChoice, EOrderedChoice, EAutoChoice
+from .shared import SharedEChoice
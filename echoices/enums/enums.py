@@ -1,6 +1,367 @@
+import asyncio
+import operator
 import warnings
 from enum import Enum, EnumMeta
-from types import DynamicClassAttribute
+from itertools import islice
+from types import DynamicClassAttribute, MappingProxyType
+
+from django.utils import translation
+
+# Kinds of operands of the comparisons, see EChoiceCache.comparisons
+_SAME_CLASS, _VALUE_TYPE, _STR_COERCIBLE, _INCOMPARABLE = range(4)
+
+# Maximal number of members of an EChoice supporting bitmasks, as stored in a signed 64-bit integer
+MAX_BITMASK_MEMBERS = 63
+
+# Number of values decoded by EChoice.adecode_many() before giving back the control to the event loop
+DECODE_CHUNK_SIZE = 10000
+
+# Range of the storage codes of an EChoice, as stored in a SmallIntegerField
+SMALLINT_RANGE = (-32768, 32767)
+
+# Orders in which the members of an EOrderedChoice are ranked, see EOrderedChoiceCache.ranks
+_ORDERS = ('sorted', 'reverse', 'natural')
+
+# Incremented each time the translations are reloaded, see EChoiceCache.translated_labels()
+_translations_generation = 0
+
+# Whether clear_translated_labels() is connected to the signals of Django, see _connect_signals()
+_signals_connected = False
+
+
+def clear_translated_labels():
+    """Discard the translated labels of all the EChoice, so that they are resolved again on next use."""
+    global _translations_generation
+    _translations_generation += 1
+
+
+def _setting_changed(setting, **kwargs):
+    # Same settings as in django.test.signals
+    if setting in {'LANGUAGES', 'LANGUAGE_CODE', 'LOCALE_PATHS'}:
+        clear_translated_labels()
+
+
+def _file_changed(file_path, **kwargs):
+    # Same condition as in django.utils.translation.reloader
+    if file_path.suffix == '.mo':
+        clear_translated_labels()
+
+
+def _connect_signals():
+    """
+    Discard the translated labels whenever the translations are reloaded. Connected on first use of the translations,
+    so that the enums do not depend on the signals of Django until then.
+
+    """
+    global _signals_connected
+    from django.core.signals import setting_changed
+    try:
+        from django.utils.autoreload import file_changed
+    except ImportError:
+        # Django < 2.2
+        file_changed = None
+    setting_changed.connect(_setting_changed, dispatch_uid='echoices_setting_changed')
+    if file_changed is not None:
+        file_changed.connect(_file_changed, dispatch_uid='echoices_file_changed')
+    _signals_connected = True
+
+
+def _str_forms(value):
+    """
+    Return the canonical string representations of `value`, as rendered in a HTML form.
+
+    Notes
+    -----
+    For a `bool`, 'False' is mapped to `False`, whereas `bool('False')` is `True`.
+
+    """
+    forms = [str(value)]
+    if type(value) is float and value.is_integer():
+        forms.append(str(int(value)))
+    return forms
+
+
+def _get_label(member):
+    """The label of the Enum member."""
+    return member._label_
+
+
+def _get_compact_label(member):
+    """The label of the Enum member."""
+    return member._choice_[1]
+
+
+def _get_choice(member):
+    return member._value_, member._label_
+
+
+def _get_compact_choice(member):
+    return member._choice_
+
+
+# Accessors of the members of an EChoice, by layout, as bound once per class by EChoiceMeta
+_ACCESSORS = {
+    'label': {False: DynamicClassAttribute(_get_label), True: DynamicClassAttribute(_get_compact_label)},
+    'choice': {False: property(_get_choice), True: property(_get_compact_choice)},
+}
+
+
+class EChoiceCache:
+    """
+    Lookup tables of an EChoice, computed once from its members.
+
+    Each EChoice class holds its own instance in the `_cache_` slot, which is set by `EChoiceMeta` when the class is
+    created, and rebuilt by `EChoice.invalidate()`. It is never shared between subclasses.
+
+    For a compact EChoice, the tables already held by the Enum are shared instead of duplicated, and `label2member` is
+    only built when first accessed.
+
+    The cache is safe to share between threads: the mappings are exposed as read-only views, and the tables which are
+    built lazily are only published once complete, by a single assignment. This includes the stores of the translated
+    tables and of the expressions of `EOrderedChoice.order_by_expression()`, which are replaced by a new read-only view
+    on each addition instead of being updated. At worst, two threads build the same table concurrently, and one of the
+    copies is discarded.
+
+    Parameters
+    ----------
+    members : iterable of EChoice
+        In the "natural" order, aka as given when instantiating.
+
+    Attributes
+    ----------
+    values : tuple
+        of all the values
+    value_set : frozenset or set-like
+        of all the values, for membership tests
+    value_type : type or None
+        of all the values, None if there is no member
+    choices : tuple
+        of all the (value, label) pairs
+    value2member : mappingproxy
+        mapping each value to its member
+    decoder : mappingproxy
+        mapping each value to its member, and `None` to `None`, as required to decode the values of a database column
+    decode : callable
+        the bound lookup of `decoder`, for bulk decoding with `map()`
+    str2member : mappingproxy
+        mapping the string representations of each value to its member, e.g. as submitted by a HTML form
+    label2member : mappingproxy
+        mapping each label to its member. Lazy labels, e.g. translations, are mapped as translated in the active
+        language.
+    value2bit : mappingproxy or None
+        mapping each value to the bit of its member in a bitmask, in the "natural" order. None if there are more than
+        `MAX_BITMASK_MEMBERS` members.
+    value2code : mappingproxy or None
+        mapping each value to its storage code, as declared in the `__codes__` of the EChoice. None if undeclared.
+    code_decoder : mappingproxy or None
+        mapping each storage code to its member, and `None` to `None`. None if undeclared.
+    max_value_length : int or None
+        the maximal length of the values, None if the values do not support `len()`
+    comparisons : mappingproxy
+        mapping the type of an operand to its kind, so that the comparison operators can dispatch on it without
+        resorting to exceptions. Types which are not listed are compared as is, then coerced if required.
+
+    Notes
+    -----
+    The labels translated in a given language are resolved on first use, then kept until the translations are
+    reloaded.
+
+    """
+    __slots__ = ('values', 'value_set', 'value_type', 'choices', 'value2member', 'decoder', 'decode', 'str2member',
+                 'value2bit', 'value2code', 'code_decoder', 'max_value_length', 'comparisons', '_members',
+                 '_label2member', '_lazy_labels', '_translations')
+
+    def __init__(self, members):
+        self._members = tuple(members)
+        compact = bool(self._members) and type(self._members[0]).__compact__
+        self.values = tuple([m.value for m in self._members])
+        self.value_type = type(self.values[0]) if self.values else None
+        self.choices = tuple([m.choice for m in self._members])
+        if compact:
+            # Share the tables of the Enum instead of duplicating them
+            value2member = type(self._members[0])._value2member_map_
+            self.value_set = value2member.keys()
+        else:
+            value2member = {m.value: m for m in self._members}
+            self.value_set = frozenset(self.values)
+        self.value2member = MappingProxyType(value2member)
+        decoder = {None: None}
+        decoder.update(value2member)
+        self.decoder = MappingProxyType(decoder)
+        self.decode = decoder.__getitem__
+        if compact and self.value_type is str:
+            self.str2member = self.value2member
+        else:
+            str2member = {}
+            for m in self._members:
+                for form in _str_forms(m.value):
+                    str2member[form] = m
+            self.str2member = MappingProxyType(str2member)
+        if len(self.values) <= MAX_BITMASK_MEMBERS:
+            self.value2bit = MappingProxyType({v: 1 << i for i, v in enumerate(self.values)})
+        else:
+            self.value2bit = None
+        self._make_codes()
+        try:
+            self.max_value_length = max([len(v) for v in self.values])
+        except (TypeError, ValueError):
+            self.max_value_length = None
+        # Lazy labels (e.g. translations) must not be evaluated when the class is created
+        self._label2member = self._lazy_labels = None
+        if not compact:
+            self._lazy_labels = not all([isinstance(m.label, str) for m in self._members])
+            if not self._lazy_labels:
+                self._label2member = MappingProxyType({m.label: m for m in self._members})
+        # The generation of the translations, and the objects built from them, are replaced together
+        self._translations = (_translations_generation, MappingProxyType({}))
+        comparisons = {}
+        if self._members:
+            comparisons[type(self._members[0])] = _SAME_CLASS
+            comparisons[self.value_type] = _VALUE_TYPE
+            if self.value_type is not str:
+                comparisons[str] = _STR_COERCIBLE
+            try:
+                self.value_type(None)
+            except TypeError:
+                comparisons[type(None)] = _INCOMPARABLE
+        self.comparisons = MappingProxyType(comparisons)
+
+    def _make_codes(self):
+        codes = type(self._members[0]).__codes__ if self._members else None
+        if codes is None:
+            self.value2code = self.code_decoder = None
+            return
+        value2code = {}
+        code_decoder = {None: None}
+        for m in self._members:
+            try:
+                code = codes[m.value]
+            except KeyError:
+                raise AttributeError("Missing storage code for value: '{}'.".format(m.value)) from None
+            if type(code) is not int or not SMALLINT_RANGE[0] <= code <= SMALLINT_RANGE[1]:
+                raise AttributeError("Invalid storage code: {}. Codes must be integers in {}.".format(
+                    code, SMALLINT_RANGE))
+            if code in code_decoder:
+                raise AttributeError("Duplicate storage code: {}.".format(code))
+            value2code[m.value] = code
+            code_decoder[code] = m
+        self.value2code = MappingProxyType(value2code)
+        self.code_decoder = MappingProxyType(code_decoder)
+
+    @property
+    def label2member(self):
+        label2member = self._label2member
+        if label2member is not None:
+            return label2member
+        if self._lazy_labels is None:
+            self._lazy_labels = not all([isinstance(m.label, str) for m in self._members])
+        if self._lazy_labels:
+            # The hash and equality of a lazy label depend on the active language, so is the table
+            language = translation.get_language()
+            return self.translated(('label2member', language), lambda: MappingProxyType(
+                dict(zip(self.translated_labels(language), self._members))))
+        label2member = self._label2member = MappingProxyType({m.label: m for m in self._members})
+        return label2member
+
+    def translated_labels(self, language):
+        """
+        Return the labels of all the members, translated in `language`.
+
+        Parameters
+        ----------
+        language : str or None
+            None to deactivate the translations
+
+        Returns
+        -------
+        tuple of str
+
+        """
+        def build():
+            with translation.override(language):
+                return tuple([str(m.label) for m in self._members])
+
+        return self.translated(language, build)
+
+    def translated_choices(self, choices, order, language):
+        """
+        Return `choices`, with the labels translated in `language`.
+
+        Parameters
+        ----------
+        choices : tuple
+            of (value, label) pairs of the members, as given by `EChoice.choices()`
+        order : str
+            in which `choices` are given, identifying them
+        language : str or None
+            None to deactivate the translations
+
+        Returns
+        -------
+        tuple
+
+        """
+        def build():
+            labels = dict(zip(self.values, self.translated_labels(language)))
+            return tuple([(value, labels[value]) for value, _ in choices])
+
+        return self.translated((order, language), build)
+
+    def translated(self, key, build):
+        """
+        Return the object identified by `key`, derived from the translated labels, as built by `build()` on first use.
+        It is kept until the translations are reloaded.
+
+        Parameters
+        ----------
+        key : hashable
+            including the language of the labels
+        build : callable
+            taking no argument
+
+        """
+        if not _signals_connected:
+            _connect_signals()
+        generation, translations = self._translations
+        if generation != _translations_generation:
+            generation, translations = _translations_generation, MappingProxyType({})
+        try:
+            return translations[key]
+        except KeyError:
+            value = build()
+            # Published as a new read-only table, so that the threads reading the current one never see it change
+            self._translations = (generation, MappingProxyType({**translations, key: value}))
+            return value
+
+
+class EOrderedChoiceCache(EChoiceCache):
+    """
+    Lookup tables of an EOrderedChoice, extending those of `EChoiceCache`.
+
+    Attributes
+    ----------
+    sorted_choices : tuple
+        of all the (value, label) pairs, sorted by `value`
+    reverse_choices : tuple
+        of all the (value, label) pairs, sorted by `value` in reverse order
+    ranks : mappingproxy
+        mapping each order to a mapping of each value to the rank of its member in that order, see
+        `EOrderedChoice.sort_key()`
+
+    """
+    __slots__ = ('sorted_choices', 'reverse_choices', 'ranks', '_order_by_expressions')
+
+    def __init__(self, members):
+        super(EOrderedChoiceCache, self).__init__(members)
+        self._order_by_expressions = MappingProxyType({})
+        ordered = sorted(self._members, key=lambda m: m._value_)
+        self.sorted_choices = tuple([m.choice for m in ordered])
+        self.reverse_choices = tuple([m.choice for m in reversed(ordered)])
+        self.ranks = MappingProxyType({
+            'sorted': MappingProxyType({m._value_: rank for rank, m in enumerate(ordered)}),
+            'reverse': MappingProxyType({m._value_: rank for rank, m in enumerate(reversed(ordered))}),
+            'natural': MappingProxyType({m._value_: rank for rank, m in enumerate(self._members)}),
+        })
 
 
 class EChoiceMeta(EnumMeta):
@@ -13,16 +374,71 @@ class EChoiceMeta(EnumMeta):
     
     """
 
+    @classmethod
+    def __prepare__(metacls, cls, bases, compact=None, **kwargs):
+        return super(EChoiceMeta, metacls).__prepare__(cls, bases, **kwargs)
+
+    def __new__(metacls, cls, bases, classdict, compact=None, **kwargs):
+        metacls._validate_members(bases, classdict)
+        if compact is not None:
+            classdict['__compact__'] = bool(compact)
+        enum_class = super(EChoiceMeta, metacls).__new__(metacls, cls, bases, classdict, **kwargs)
+        # Bind the accessors of the layout of the members, instead of checking it on each access
+        for name, accessors in _ACCESSORS.items():
+            inherited = next((k.__dict__[name] for k in enum_class.__mro__ if name in k.__dict__), None)
+            if inherited in accessors.values() and name not in enum_class._member_map_:
+                setattr(enum_class, name, accessors[enum_class.__compact__])
+        # SEE: https://stackoverflow.com/a/35953630/
+        # SEE: https://docs.djangoproject.com/en/stable/ref/templates/api/#variables-and-lookups
+        enum_class.do_not_call_in_templates = True
+        enum_class.invalidate()
+        return enum_class
+
+    @staticmethod
+    def _validate_members(bases, classdict):
+        """
+        Ensure that the values of the members being defined are unique and of the same type, in a single pass.
+
+        Raises
+        ------
+        TypeError
+            in case of values of different types
+        AttributeError
+            in case of duplicated values
+
+        """
+        member_names = list(classdict._member_names)
+        if not member_names:
+            return
+        # The Enum base is always the last one
+        value_from_args = bases[-1]._value_from_args
+        value_type = None
+        seen = set()
+        for index, name in enumerate(member_names):
+            args = classdict[name]
+            if not isinstance(args, tuple):
+                args = (args,)
+            value = value_from_args(index, *args)
+            if value_type is None:
+                value_type = type(value)
+            elif type(value) is not value_type:
+                raise TypeError("Incompatible type: {}. All values must be {}.".format(type(value), value_type))
+            if value in seen:
+                raise AttributeError(
+                    "Duplicate value: '{}'. Only unique values are supported in {}.".format(value, EChoice))
+            seen.add(value)
+
     def __getitem__(cls, value):
-        try:
-            # Should always be there (at least in Python 3.5)
-            return cls._value2member_map_[value]
-        except AttributeError:
-            value2member_map_ = {}
-            for echoice in list(cls):
-                value2member_map_[echoice.value] = echoice
-            cls._value2member_map_ = value2member_map_
-            return cls._value2member_map_[value]
+        return cls._cache_.value2member[value]
+
+    def __call__(cls, value, *args, **kwargs):
+        if not args and not kwargs:
+            # Fast path for the lookup of a member by its value, e.g. when unpickling
+            try:
+                return cls._cache_.value2member[value]
+            except (KeyError, TypeError):
+                pass
+        return super(EChoiceMeta, cls).__call__(value, *args, **kwargs)
 
 
 class EChoice(Enum, metaclass=EChoiceMeta):
@@ -39,42 +455,59 @@ class EChoice(Enum, metaclass=EChoiceMeta):
     `EChoice.value` returns the actual value to be stored in the DB, while the legacy `Enum.value`
     would return the whole tuple used when defining the enumeration item.
     
+    The members of a compact EChoice, declared with `class MyEnum(EChoice, compact=True)`, hold their (value, label)
+    pair in a single tuple, which is shared with the `choices()` of the class. Together with the lookup tables shared
+    with the Enum, this reduces the memory footprint of large enumerations by about a third. The members still have a
+    `__dict__`, as the members of an Enum can not use slots.
+
+    The members can be stored as integer codes instead of their values, see `make_echoicefield()`. The codes are
+    declared explicitly with `__codes__`, a dict mapping each value to a distinct integer fitting in a
+    `SmallIntegerField`. As they are persisted, codes must never be changed nor reused once deployed, extra entries
+    being allowed to keep the codes of retired values reserved.
+
     Raises
     ------
     AttributeError
-        in case of duplicated values
+        in case of duplicated values, or of missing, invalid or duplicated storage codes
 
     See Also
     --------
     http://stackoverflow.com/a/24105344
 
     """
+    __compact__ = False
+    __codes__ = None
 
     def __new__(cls, value, label, *args, **kwargs):
-        if len(cls) == 0:
-            cls.__value_type_ = type(value)
-            # SEE: https://stackoverflow.com/a/35953630/
-            # SEE: https://docs.djangoproject.com/en/stable/ref/templates/api/#variables-and-lookups
-            cls.do_not_call_in_templates = True
-        else:
-            if type(value) is not cls.__value_type_:
-                raise TypeError("Incompatible type: {}. All values must be {}.".format(type(value), cls.__value_type_))
-            if value in [c.value for c in list(cls)]:
-                raise AttributeError(
-                    "Duplicate value: '{}'. Only unique values are supported in {}.".format(value, EChoice))
+        # Values are validated beforehand by EChoiceMeta
+        return cls._new_member(value, label)
+
+    @classmethod
+    def _new_member(cls, value, label):
         obj = object.__new__(cls)
         obj._value_ = value  # Overrides default _value_
-        obj._label_ = label
+        if cls.__compact__:
+            obj._choice_ = (value, label)
+        else:
+            obj._label_ = label
         return obj
 
-    @DynamicClassAttribute
-    def label(self):
-        """The label of the Enum member."""
-        return self._label_
+    @staticmethod
+    def _value_from_args(index, value, label, *args, **kwargs):
+        """
+        Return the `value` of the member defined with `args`, as it will be set by `__new__`. Used by `EChoiceMeta` to
+        validate the values before the members are created.
 
-    @property
-    def choice(self):
-        return self.value, self.label
+        Parameters
+        ----------
+        index : int
+            of the member in the definition order
+
+        """
+        return value
+
+    label = _ACCESSORS['label'][False]
+    choice = _ACCESSORS['choice'][False]
 
     def __call__(self, attr='value'):
         """
@@ -117,6 +550,19 @@ class EChoice(Enum, metaclass=EChoiceMeta):
         except TypeError:
             return 1
 
+    @classmethod
+    def _make_cache(cls):
+        return EChoiceCache(list(cls))
+
+    @classmethod
+    def invalidate(cls):
+        """
+        Rebuild the lookup tables of this Enum, held in its `_cache_` slot. They are computed once when the class is
+        created, so this is only required if the members are altered afterwards.
+
+        """
+        cls._cache_ = cls._make_cache()
+
     @classmethod
     def values(cls):
         """
@@ -127,9 +573,7 @@ class EChoice(Enum, metaclass=EChoiceMeta):
             of all the values of this Enum
         
         """
-        if not hasattr(cls, '__values_'):
-            cls.__values_ = tuple([c.value for c in list(cls)])
-        return cls.__values_
+        return cls._cache_.values
 
     @classmethod
     def max_value_length(cls):
@@ -142,24 +586,51 @@ class EChoice(Enum, metaclass=EChoiceMeta):
             the maximal length required by this Enum to be stored in the database
 
         """
-        if not hasattr(cls, '__max_value_length_'):
-            cls.__max_value_length_ = max([len(c.value) for c in list(cls)])
-        return cls.__max_value_length_
+        max_value_length = cls._cache_.max_value_length
+        if max_value_length is None:
+            # Raises the appropriate error
+            return max([len(c.value) for c in list(cls)])
+        return max_value_length
 
     @classmethod
-    def choices(cls):
+    def choices(cls, language=None):
         """
         Generate the choices as required by Django models.
 
+        Parameters
+        ----------
+        language : str
+            If given, the labels are translated in this language. They are resolved once per language.
+
         Returns
         -------
         tuple
 
         """
         # "natural" order, aka as given when instantiating
-        if not hasattr(cls, '__choices_'):
-            cls.__choices_ = tuple([c.choice for c in list(cls)])
-        return cls.__choices_
+        if language is None:
+            return cls._cache_.choices
+        return cls._cache_.translated_choices(cls._cache_.choices, 'natural', language)
+
+    @classmethod
+    def labels(cls, language=None):
+        """
+        Return the labels of all the elements, translated. They are resolved once per language, until the translations
+        are reloaded.
+
+        Parameters
+        ----------
+        language : str
+            If not given, the active language.
+
+        Returns
+        -------
+        tuple of str
+
+        """
+        if language is None:
+            language = translation.get_language()
+        return cls._cache_.translated_labels(language)
 
     @classmethod
     def from_value(cls, value):
@@ -195,7 +666,8 @@ class EChoice(Enum, metaclass=EChoiceMeta):
         Parameters
         ----------
         value
-            In the type of the `value` field, as set when instantiating this EChoice.
+            In the type of the `value` field, as set when instantiating this EChoice, or its string representation,
+            typically coming from a HTML form.
         default
             Returned if the value is not found.
 
@@ -204,14 +676,177 @@ class EChoice(Enum, metaclass=EChoiceMeta):
         EChoice
 
         """
-        try:
-            return cls[value]
-        except KeyError:
-            return default
+        cache = cls._cache_
+        member = cache.value2member.get(value)
+        if member is None and type(value) is str:
+            member = cache.str2member.get(value)
+        return default if member is None else member
+
+    @classmethod
+    def decode_many(cls, values):
+        """
+        Return the EChoice objects associated with these values, in a single pass. Intended use case is to decode a
+        whole column of raw values, e.g. as fetched from the database.
+
+        Parameters
+        ----------
+        values : iterable
+            In the type of the `value` field, as set when instantiating this EChoice. `None` is kept as is.
+
+        Returns
+        -------
+        list of EChoice
+
+        Raises
+        ------
+        KeyError
+            if any value does not exist in any element
+
+        """
+        return list(map(cls._cache_.decode, values))
+
+    @classmethod
+    async def adecode_many(cls, values, chunk_size=DECODE_CHUNK_SIZE):
+        """
+        Asynchronous counterpart of `decode_many()`. The values are decoded by chunks, and the control is given back to
+        the event loop between two chunks, so that decoding a large export does not block the other coroutines.
+
+        Parameters
+        ----------
+        values : iterable or asynchronous iterable
+            In the type of the `value` field, as set when instantiating this EChoice. `None` is kept as is.
+        chunk_size : int
+            Number of values decoded in a row, positive.
+
+        Returns
+        -------
+        list of EChoice
+
+        Raises
+        ------
+        KeyError
+            if any value does not exist in any element
+        ValueError
+            if `chunk_size` is not positive
+
+        Examples
+        --------
+        >>> states = await EStates.adecode_many(row['state'] for row in json.loads(export))
+
+        """
+        if chunk_size <= 0:
+            raise ValueError("Invalid chunk size: {}. Must be positive.".format(chunk_size))
+        decode = cls._cache_.decode
+        members = []
+        if hasattr(values, '__aiter__'):
+            chunk = []
+            async for value in values:
+                chunk.append(value)
+                if len(chunk) >= chunk_size:
+                    members.extend(map(decode, chunk))
+                    chunk = []
+                    await asyncio.sleep(0)
+            members.extend(map(decode, chunk))
+            return members
+        values = iter(values)
+        while True:
+            decoded = len(members)
+            members.extend(map(decode, islice(values, chunk_size)))
+            if len(members) - decoded < chunk_size:
+                return members
+            await asyncio.sleep(0)
+
+    @classmethod
+    def to_mask(cls, echoices):
+        """
+        Return the bitmask of these EChoice objects, with one bit per element in the "natural" order.
+
+        Parameters
+        ----------
+        echoices : iterable
+            of EChoice objects, or of values in the type of the `value` field
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        KeyError
+            if any value does not exist in any element
+        NotImplementedError
+            if this Enum has more than `MAX_BITMASK_MEMBERS` elements
+
+        """
+        value2bit = cls._get_value2bit()
+        mask = 0
+        for echoice in echoices:
+            mask |= value2bit[echoice._value_ if isinstance(echoice, cls) else echoice]
+        return mask
+
+    @classmethod
+    def from_mask(cls, mask):
+        """
+        Return the EChoice objects of this bitmask, as given by `to_mask()`.
+
+        Parameters
+        ----------
+        mask : int
+
+        Returns
+        -------
+        frozenset of EChoice
+
+        Raises
+        ------
+        ValueError
+            if `mask` has bits not matching any element
+        NotImplementedError
+            if this Enum has more than `MAX_BITMASK_MEMBERS` elements
+
+        """
+        cls._get_value2bit()
+        members = cls._cache_._members
+        if mask < 0 or mask >> len(members):
+            raise ValueError("Invalid bitmask for {}: {}".format(cls.__name__, mask))
+        echoices = []
+        while mask:
+            bit = mask & -mask
+            echoices.append(members[bit.bit_length() - 1])
+            mask ^= bit
+        return frozenset(echoices)
+
+    @classmethod
+    def _get_value2bit(cls):
+        value2bit = cls._cache_.value2bit
+        if value2bit is None:
+            raise NotImplementedError("Bitmasks are only supported up to {} elements, {} has {}".format(
+                MAX_BITMASK_MEMBERS, cls.__name__, len(cls)))
+        return value2bit
+
+    @classmethod
+    def get_by_label(cls, label, default=None):
+        """
+        Return the EChoice object associated with this label, else `default`.
+
+        Parameters
+        ----------
+        label
+            As set when instantiating this EChoice. Lazy labels, e.g. translations, are looked up as translated in the
+            active language.
+        default
+            Returned if the label is not found.
+
+        Returns
+        -------
+        EChoice
+
+        """
+        return cls._cache_.label2member.get(label, default)
 
     @classmethod
     def __getvaluetype__(cls):
-        return cls.__value_type_
+        return cls._cache_.value_type
 
     @classmethod
     def coerce(cls, other):
@@ -228,48 +863,158 @@ class EChoice(Enum, metaclass=EChoiceMeta):
         the `other` value in the type of the value of this EChoice.
 
         """
-        return cls.__value_type_(other)
+        return cls._cache_.value_type(other)
 
-    def __lt__(self, other):
-        if self.__class__ is other.__class__:
-            return self.value < other.value
+    def _compare(self, other, op):
+        kind = self._cache_.comparisons.get(type(other))
+        if kind == _SAME_CLASS:
+            return op(self._value_, other._value_)
+        if kind == _VALUE_TYPE:
+            return op(self._value_, other)
+        if kind == _STR_COERCIBLE:
+            return op(self._value_, self.coerce(other))
+        if kind == _INCOMPARABLE:
+            return NotImplemented
         try:
-            return self.value < other
+            return op(self._value_, other)
         except TypeError:
-            return self.value < self.coerce(other)
+            return op(self._value_, self.coerce(other))
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
 
     def __le__(self, other):
-        return self < other or self == other
+        return self._compare(other, operator.le)
 
     def __eq__(self, other):
-        if self.__class__ is other.__class__:
-            return self.value == other.value
+        kind = self._cache_.comparisons.get(type(other))
+        if kind == _SAME_CLASS:
+            # Members are singletons with unique values
+            return self is other
+        if kind == _VALUE_TYPE:
+            return self._value_ == other
+        if kind == _INCOMPARABLE:
+            return False
         try:
-            return self.value == self.coerce(other)
+            return self._value_ == self.coerce(other)
         except (TypeError, ValueError):
             return False
 
     def __ge__(self, other):
-        return self == other or self > other
+        return self._compare(other, operator.ge)
 
     def __gt__(self, other):
-        if self.__class__ is other.__class__:
-            return self.value > other.value
-        try:
-            return self.value > other
-        except TypeError:
-            return self.value > self.coerce(other)
+        return self._compare(other, operator.gt)
 
     def __hash__(self):
         # Somewhat required since comparison operators are defined
         return super().__hash__()
 
+    def __reduce_ex__(self, proto):
+        # Pickled as (class, value), which are resolved back to this very member by `EChoiceMeta.__call__()`
+        return self.__class__, (self._value_,)
+
 
 class EOrderedChoice(EChoice):
     """Provide ordering of the elements"""
 
     @classmethod
-    def choices(cls, order='natural'):
+    def _make_cache(cls):
+        return EOrderedChoiceCache(list(cls))
+
+    @DynamicClassAttribute
+    def rank(self):
+        """The rank of the Enum member, when sorted by `value`."""
+        return self._cache_.ranks['sorted'][self._value_]
+
+    @classmethod
+    def sort_key(cls, order='sorted', attr=None, nullable=True):
+        """
+        Return a function giving the rank of an element in the given order, to be used as the `key` of `sorted()`. It
+        is faster than comparing the elements themselves. `None` is ranked first, before every element.
+
+        Handling `None` requires a function written in Python. If the elements can not be `None`, pass
+        `nullable=False`: for the 'sorted' order, the function is then a C callable of the operator module, nearly twice
+        as fast. For the 'reverse' order at the same speed, use this key of the 'sorted' order with `reverse=True`,
+        which gives the same result, as the elements only tie with themselves.
+
+        Parameters
+        ----------
+        order : str
+            see `choices()`
+        attr : str
+            If given, the function applies to objects holding an element in their attribute `attr`, e.g. the instances
+            of a model with an `EChoiceField`, rather than to the elements themselves.
+        nullable : bool
+            If False, the elements are never `None`.
+
+        Returns
+        -------
+        callable
+
+        Examples
+        --------
+        >>> sorted(instances, key=MyEnum.sort_key('reverse', 'my_field'))
+        >>> sorted(members, key=MyEnum.sort_key(nullable=False), reverse=True)
+
+        """
+        assert order in _ORDERS, \
+            "Sorting order not recognized: {}. Available options are: {}".format(order, list(_ORDERS))
+        ranks = cls._cache_.ranks[order]
+        if not nullable:
+            get_value = operator.attrgetter('{}._value_'.format(attr) if attr else '_value_')
+            if order == 'sorted':
+                # The members are ranked by their values in this order
+                return get_value
+            return lambda obj: ranks[get_value(obj)]
+        get = operator.attrgetter(attr) if attr else None
+
+        def key(obj):
+            member = obj if get is None else get(obj)
+            return -1 if member is None else ranks[member._value_]
+
+        return key
+
+    @classmethod
+    def order_by_expression(cls, field, order='natural'):
+        """
+        Return an expression giving the rank in the given order of the element stored in `field`, so that the database
+        can sort by it, typically with `queryset.order_by()`. It is built once per field and order, then reused.
+
+        Parameters
+        ----------
+        field : str
+            Name of the field storing the values of this Enum, as given to `queryset.filter()`.
+        order : str
+            see `choices()`. Note that with 'sorted', ordering by `field` directly is equivalent.
+
+        Returns
+        -------
+        django.db.models.Case
+
+        Examples
+        --------
+        >>> MyModel.objects.order_by(MyEnum.order_by_expression('my_field'))
+
+        """
+        assert order in _ORDERS, \
+            "Sorting order not recognized: {}. Available options are: {}".format(order, list(_ORDERS))
+        key = (field, order)
+        cache = cls._cache_
+        expressions = cache._order_by_expressions
+        try:
+            return expressions[key]
+        except KeyError:
+            # Imported here, so that the enums do not depend on the ORM
+            from django.db.models import Case, IntegerField, Value, When
+            expression = Case(*[When(**{field: value, 'then': Value(rank)})
+                                for value, rank in cache.ranks[order].items()], output_field=IntegerField())
+            # Published as a new read-only table, as the translations of the cache
+            cache._order_by_expressions = MappingProxyType({**expressions, key: expression})
+            return expression
+
+    @classmethod
+    def choices(cls, order='natural', language=None):
         """
         Generate the choices as required by Django models.
 
@@ -281,6 +1026,8 @@ class EOrderedChoice(EChoice):
             * 'reverse', the elements will be sorted by `value` as if each comparison were 
                 reversed
             * 'natural' (default), the elements are ordered as when instantiated in the enumeration
+        language : str
+            If given, the labels are translated in this language. They are resolved once per language.
                 
         Returns
         -------
@@ -290,17 +1037,15 @@ class EOrderedChoice(EChoice):
         INC, DEC, NAT = 'sorted', 'reverse', 'natural'
         options = [INC, DEC, NAT]
         assert order in options, "Sorting order not recognized: {}. Available options are: {}".format(order, options)
-        if order in [INC, DEC]:
-            reverse = order == DEC
-            if reverse:
-                attr = '__choices_reverse_'
-            else:
-                attr = '__choices_sorted_'
-            if not hasattr(cls, attr):
-                setattr(cls, attr, tuple([(c.value, c.label) for c in sorted(list(cls), reverse=reverse)]))
-            return getattr(cls, attr)
+        if order == INC:
+            choices = cls._cache_.sorted_choices
+        elif order == DEC:
+            choices = cls._cache_.reverse_choices
         else:
-            return super(EOrderedChoice, cls).choices()
+            return super(EOrderedChoice, cls).choices(language=language)
+        if language is None:
+            return choices
+        return cls._cache_.translated_choices(choices, order, language)
 
 
 class EAutoChoice(EOrderedChoice):
@@ -314,8 +1059,8 @@ class EAutoChoice(EOrderedChoice):
     """
 
     def __new__(cls, label, *args, **kwargs):
-        value = len(cls.__members__) + 1
-        obj = object.__new__(cls)
-        obj._value_ = value
-        obj._label_ = label
-        return obj
+        return cls._new_member(len(cls.__members__) + 1, label)
+
+    @staticmethod
+    def _value_from_args(index, label, *args, **kwargs):
+        return index + 1
@@ -0,0 +1,215 @@
+import marshal
+import mmap
+import os
+import sys
+
+from .enums import EAutoChoice, EChoice
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # Python < 3.8
+    shared_memory = None
+
+
+class SharedEChoice:
+    """
+    Handle on the members of an EChoice, written once in a block of shared memory, from which other processes read them
+    instead of generating the enumeration again.
+
+    The handle is created by the parent process with `SharedEChoice.create()`, then passed to the workers, e.g. in the
+    `initargs` of a `ProcessPoolExecutor`. It is pickled as the name of the block: a worker only reads the block on
+    first access, and only materializes the members on first access of `echoice`. Until then, `choices`, `label()` and
+    `in` are served from the names, values and labels read from the block, with an index of the values built on first
+    lookup. The parent remains the owner of the block, and releases it with `unlink()` once the workers are done.
+
+    Materializing the members costs as much as creating the EChoice class, as the members are instantiated by `Enum`:
+    only the generation of their names, values and labels is saved. Workers which only need the choices or the labels
+    never pay for the members. The class built by the workers does not have the methods defined on the original EChoice,
+    and its members can not be pickled, so send their values across processes instead. This is intended for large
+    generated enumerations.
+
+    Parameters
+    ----------
+    name : str
+        of the shared memory block
+    cls_name : str
+        of the EChoice class built by the workers
+    base : type
+        EChoice, or a subclass without member, from which the class is built
+    compact : bool
+        layout of the members of the class built by the workers, see `EChoice`
+
+    Examples
+    --------
+    >>> shared = SharedEChoice.create(EStates)
+    >>> with ProcessPoolExecutor(initializer=init_worker, initargs=(shared,)) as executor:
+    ...     executor.map(process, chunks)
+    >>> shared.unlink()
+
+    """
+
+    def __init__(self, name, cls_name, base=EChoice, compact=True):
+        self.name = name
+        self.cls_name = cls_name
+        self.base = base
+        self.compact = compact
+        self._shm = None
+        self._members = None
+        self._index = None
+        self._choices = None
+        self._echoice = None
+
+    @classmethod
+    def create(cls, echoice, name=None, compact=True):
+        """
+        Write the members of `echoice` in a new block of shared memory.
+
+        Parameters
+        ----------
+        echoice : type
+            subclass of EChoice
+        name : str or None
+            of the shared memory block, None for a unique name
+        compact : bool
+            layout of the members of the class built by the workers, see `EChoice`
+
+        Returns
+        -------
+        SharedEChoice
+            owning the shared memory block
+
+        Raises
+        ------
+        TypeError
+            if a value is not a `str`, `int`, `float` or `bool`, or if a label is not a `str`, e.g. a lazy translation
+        RuntimeError
+            if shared memory is not supported
+
+        """
+        if shared_memory is None:
+            raise RuntimeError("Shared memory requires Python 3.8 or later.")
+        members = list(echoice)
+        values = echoice.values()
+        # Checked beforehand, as marshal only supports the exact built-in types, and raises a ValueError otherwise
+        for value in values:
+            if type(value) not in (str, int, float, bool):
+                raise TypeError(
+                    "Invalid value: {!r}. Only str, int, float and bool values can be shared.".format(value))
+        for m in members:
+            if type(m.label) is not str:
+                raise TypeError("Invalid label: {!r}. Only str labels can be shared.".format(m.label))
+        data = marshal.dumps((tuple([m.name for m in members]), values, tuple([m.label for m in members])))
+        shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        shm.buf[:len(data)] = data
+        # The Enum base is always the last one
+        shared = cls(shm.name, echoice.__name__, echoice.__bases__[-1], compact)
+        shared._shm = shm
+        return shared
+
+    def __reduce__(self):
+        return self.__class__, (self.name, self.cls_name, self.base, self.compact)
+
+    def _get_members(self):
+        members = self._members
+        if members is None:
+            # Extra bytes, as the block is rounded up to a whole page, are ignored
+            if self._shm is not None:
+                members = marshal.loads(self._shm.buf)
+            else:
+                members = _read_block(self.name)
+            self._members = members
+        return members
+
+    def _get_index(self):
+        index = self._index
+        if index is None:
+            _, values, _ = self._get_members()
+            index = self._index = {value: i for i, value in enumerate(values)}
+        return index
+
+    @property
+    def choices(self):
+        """tuple of the (value, label) pairs of the members, read from the shared memory block on first access."""
+        choices = self._choices
+        if choices is None:
+            _, values, labels = self._get_members()
+            choices = self._choices = tuple(zip(values, labels))
+        return choices
+
+    def label(self, value, default=None):
+        """
+        Return the label of the member of this value, without materializing the members.
+
+        Parameters
+        ----------
+        value
+            In the type of the `value` field of the members.
+        default : object
+            Returned if `value` does not exist in any member.
+
+        Returns
+        -------
+        str
+
+        """
+        i = self._get_index().get(value)
+        if i is None:
+            return default
+        return self._get_members()[2][i]
+
+    def __contains__(self, value):
+        return value in self._get_index()
+
+    @property
+    def echoice(self):
+        """The EChoice class, with its members materialized from the shared memory block on first access."""
+        echoice = self._echoice
+        if echoice is None:
+            names, values, labels = self._get_members()
+            metacls = type(self.base)
+            bases = (self.base,)
+            classdict = metacls.__prepare__(self.cls_name, bases, compact=self.compact)
+            if issubclass(self.base, EAutoChoice):
+                # The values are generated again from the order of the members
+                for name, label in zip(names, labels):
+                    classdict[name] = (label,)
+            else:
+                for name, value, label in zip(names, values, labels):
+                    classdict[name] = (value, label)
+            echoice = self._echoice = metacls(self.cls_name, bases, classdict, compact=self.compact)
+        return echoice
+
+    def unlink(self):
+        """Release the shared memory block. Only the process which created it may call this method."""
+        assert self._shm is not None, "Only the process which created the shared memory block can release it."
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+
+def _read_block(name):
+    """
+    Return the content of the shared memory block `name`, unmarshalled. The block is not registered to the resource
+    tracker of this process, which would otherwise unlink it when this process exits, unless it is shared with the
+    creator of the block, which would then unregister the block twice.
+
+    """
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    elif os.name == 'posix':
+        # As SharedMemory does on POSIX systems, but without registering the block
+        import _posixshmem
+        fd = _posixshmem.shm_open('/' + name, os.O_RDONLY, mode=0o600)
+        try:
+            with mmap.mmap(fd, os.fstat(fd).st_size, prot=mmap.PROT_READ) as buf:
+                return marshal.loads(buf)
+        finally:
+            os.close(fd)
+    else:
+        # The blocks are not tracked on Windows
+        shm = shared_memory.SharedMemory(name=name)
+    try:
+        return marshal.loads(shm.buf)
+    finally:
+        shm.close()
@@ -1 +1 @@
-from .fields import make_echoicefield
+from .fields import make_echoicefield, make_multiple_echoicefield, trusted_values
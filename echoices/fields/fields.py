@@ -1,13 +1,53 @@
 import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
 from distutils.version import StrictVersion
+from functools import partialmethod
 
 from django import get_version as django_version
 from django.core import exceptions
+from django.core.exceptions import EmptyResultSet
 from django.db import models
+from django.db.models.lookups import Exact, In
+from django.utils.functional import cached_property
+from django.utils.encoding import force_str
 from django.utils.translation import ugettext_lazy as _
 
 from echoices.enums import EChoice
-from echoices.forms import TypedEChoiceField
+from echoices.enums.enums import MAX_BITMASK_MEMBERS
+from echoices.forms import TypedEChoiceField, TypedMultipleEChoiceField
+
+_DJANGO_PRE_1_9 = StrictVersion(django_version()) < StrictVersion('1.9.0')
+
+# Set by trusted_values()
+_trusted = ContextVar('echoices_trusted', default=False)
+
+# Integer fields from the narrowest, with the range of their values, see _get_integer_field_class()
+_INTEGER_FIELDS = (
+    (models.PositiveSmallIntegerField, 0, 2 ** 15 - 1),
+    (models.SmallIntegerField, -2 ** 15, 2 ** 15 - 1),
+    (models.IntegerField, -2 ** 31, 2 ** 31 - 1),
+    (models.BigIntegerField, -2 ** 63, 2 ** 63 - 1),
+)
+
+# Classes of the fields created by make_echoicefield() and make_multiple_echoicefield(), by (template, echoices, base
+# field class, class name)
+_field_classes = {}
+
+
+@contextmanager
+def trusted_values():
+    """
+    Context manager within which the raw values given to `EChoiceField.get_prep_value()` are not validated against the
+    values of the enum. Intended for trusted bulk-loading paths, e.g. `bulk_create()` of already validated data.
+    Applies to the current context only, i.e. to the current thread, or to the current task in asynchronous code.
+
+    """
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
 
 
 class EChoiceField(models.Field):
@@ -22,6 +62,13 @@ class EChoiceField(models.Field):
     ----------
     echoices : subclass of EChoice
         The choices this field supports.
+    order : str
+        In which the choices are given, see `EOrderedChoice.choices()`.
+    trusted : bool
+        If True, the raw values given to `get_prep_value()` are not validated against the values of `echoices`.
+    check_constraint : bool
+        If True, the column is restricted to the stored values of `echoices` by a database CHECK constraint. Only
+        supported for integers.
     * args
         Are passed to the derived models.Field
     * kwargs
@@ -30,9 +77,11 @@ class EChoiceField(models.Field):
     """
     description = _("A derived Field supporting enumerated choices")
 
-    def __init__(self, echoices, *args, order=None, **kwargs):
+    def __init__(self, echoices, *args, order=None, trusted=False, check_constraint=False, **kwargs):
         self.echoices = echoices
         self.order = order
+        self.trusted = trusted
+        self.check_constraint = check_constraint
         kwargs['choices'] = self._get_sorted_choices()
         default = kwargs.get('default')
         if default:
@@ -44,6 +93,12 @@ class EChoiceField(models.Field):
         if issubclass(self.__class__, models.CharField):
             kwargs['max_length'] = echoices.max_value_length()
         super(self.__class__, self).__init__(*args, **kwargs)
+        self._flatchoices = [(self.echoices[value], label) for value, label in kwargs['choices']]
+        # Labels by member and by value, members being hashed by their name
+        self._value2label = {}
+        for echoice, label in self._flatchoices:
+            self._value2label[echoice] = label
+            self._value2label[echoice.value] = label
 
     def _get_sorted_choices(self):
         if self.order:
@@ -52,10 +107,15 @@ class EChoiceField(models.Field):
 
     @property
     def flatchoices(self):
-        flat = []
-        for value, label in self._get_sorted_choices():
-            flat.append((self.echoices.get(value), label))
-        return flat
+        return self._flatchoices
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        # As Django does, don't override a get_FOO_display() method defined explicitly on this class
+        display = 'get_{}_display'.format(name)
+        overridden = display in cls.__dict__
+        super(self.__class__, self).contribute_to_class(cls, name, *args, **kwargs)
+        if not overridden:
+            setattr(cls, display, partialmethod(_get_echoicefield_display, field=self))
 
     def get_default(self):
         default = super(self.__class__, self).get_default()
@@ -64,13 +124,16 @@ class EChoiceField(models.Field):
         return default
 
     def from_db_value(self, value, *args):
-        if value is None:
-            return value
-        return self.echoices[value]
+        return self.echoices._cache_.decoder[value]
 
     def to_python(self, value):
         if isinstance(value, self.echoices) or value is None:
             return value
+        if isinstance(value, str):
+            # Fast path for the values coming from a HTML form
+            member = self.echoices.get(value)
+            if member is not None:
+                return member
         try:
             return self.echoices[self.echoices.coerce(value)]
         except (TypeError, ValueError):
@@ -89,20 +152,83 @@ class EChoiceField(models.Field):
     def get_prep_value(self, value):
         if isinstance(value, self.echoices):
             return value.value
-        assert value in self.echoices.values() or value in ['', None]
+        if not self.trusted and not _trusted.get():
+            assert value in self.echoices._cache_.value_set or value in ['', None]
         return value
 
     def formfield(self, **kwargs):
         defaults = {'choices_form_class': TypedEChoiceField}
         defaults.update(kwargs)
-        return super(self.__class__, self).formfield(**defaults)
+        formfield = super(self.__class__, self).formfield(**defaults)
+        if isinstance(formfield, TypedEChoiceField) and 'choices' not in kwargs:
+            # Choices are those of the enum, thus can be looked up directly
+            formfield.order = self.order
+            formfield.echoices = self.echoices
+        return formfield
+
+    def db_check(self, connection):
+        check = super(self.__class__, self).db_check(connection)
+        if not self.check_constraint:
+            return check
+        values = sorted(self._get_stored_values())
+        column = connection.ops.quote_name(self.column)
+        if values[-1] - values[0] + 1 == len(values):
+            constraint = '{} BETWEEN {:d} AND {:d}'.format(column, values[0], values[-1])
+        else:
+            constraint = '{} IN ({})'.format(column, ', '.join(['{:d}'.format(v) for v in values]))
+        return '({}) AND ({})'.format(check, constraint) if check else constraint
+
+    def _get_stored_values(self):
+        return self.echoices._cache_.values
 
     def validate(self, value, model_instance):
         """
         Validates value and throws ValidationError. Subclasses should override
         this to provide validation logic.
         """
-        return super(self.__class__, self).validate(value.value, model_instance)
+        if isinstance(value, self.echoices):
+            if self.blank or value._value_ not in self.empty_values:
+                # A member is a valid choice, without scanning them
+                return
+            value = value._value_
+        return super(self.__class__, self).validate(value, model_instance)
+
+    def run_validators(self, value):
+        if value in self.empty_values:
+            return
+        if not isinstance(value, self.echoices):
+            return super(self.__class__, self).run_validators(value)
+        errors = []
+        for v in self._member_validators:
+            try:
+                v(value)
+            except exceptions.ValidationError as e:
+                if hasattr(e, 'code') and e.code in self.error_messages:
+                    e.message = self.error_messages[e.code]
+                errors.extend(e.error_list)
+        if errors:
+            raise exceptions.ValidationError(errors)
+
+    @cached_property
+    def _member_validators(self):
+        """
+        The validators to run on a member. Those added by the derived field, e.g. the `MaxLengthValidator` of a
+        `models.CharField`, are skipped if all the members pass them.
+
+        """
+        own = [*self.default_validators, *self._validators]
+        own_ids = set(map(id, own))
+        validators = []
+        for v in self.validators:
+            if id(v) not in own_ids:
+                try:
+                    for member in self.echoices:
+                        v(member)
+                    continue
+                except exceptions.ValidationError:
+                    pass
+            validators.append(v)
+        return validators
 
     def deconstruct(self):
         name, path, args, kwargs = super(self.__class__, self).deconstruct()
@@ -114,10 +240,144 @@ class EChoiceField(models.Field):
         kwargs['echoices'] = self.echoices
         if self.has_default():
             kwargs['default'] = self.get_default()
+        if self.trusted:
+            kwargs['trusted'] = True
+        if self.check_constraint:
+            kwargs['check_constraint'] = True
+        return name, path, args, kwargs
+
+
+class CodedEChoiceField(EChoiceField):
+    """
+    Specialized field for single choices, stored as the integer codes declared in the `__codes__` of the `EChoice`
+    instead of their values. Not intended to be called directly but instantiated via `make_echoicefield()`.
+
+    The field still exposes and accepts the members and their values, which are translated to and from the codes when
+    querying the database.
+
+    Parameters
+    ----------
+    echoices : subclass of EChoice
+        The choices this field supports, declaring their `__codes__`.
+    coded : bool
+        Always True, as given back by `deconstruct()` so that `make_echoicefield()` builds this field again.
+    * args
+        Are passed to `EChoiceField`
+    * kwargs
+        Are passed to `EChoiceField`
+
+    """
+
+    def __init__(self, echoices, *args, coded=True, **kwargs):
+        assert coded, "A {} always stores the codes of the values".format(self.__class__.__name__)
+        EChoiceField.__init__(self, echoices, *args, **kwargs)
+
+    @cached_property
+    def validators(self):
+        # The range of the codes is already checked by the enum, while the validators apply to the members
+        return [*self.default_validators, *self._validators]
+
+    def from_db_value(self, value, *args):
+        try:
+            return self.echoices._cache_.code_decoder[value]
+        except KeyError:
+            raise ValueError("Unknown storage code for {} in {}: {}. Codes of retired values can not be read back."
+                             .format(self.echoices.__name__, self, value)) from None
+
+    def _get_stored_values(self):
+        return self.echoices._cache_.value2code.values()
+
+    def deconstruct(self):
+        name, path, args, kwargs = EChoiceField.deconstruct(self)
+        kwargs['coded'] = True
         return name, path, args, kwargs
 
+    def get_prep_value(self, value):
+        if isinstance(value, self.echoices):
+            return self.echoices._cache_.value2code[value.value]
+        if value in ['', None]:
+            return None
+        try:
+            return self.echoices._cache_.value2code[value]
+        except KeyError:
+            raise ValueError("Invalid value for {} in {}: {}".format(self.echoices.__name__, self, value)) from None
+
+
+class LabelLookup(Exact):
+    """
+    The label of the member in the field is the given one. Resolved to the value of that member.
+
+    """
+    lookup_name = 'label'
+    can_use_none_as_rhs = True
+
+    def get_prep_lookup(self):
+        self.rhs = self.lhs.output_field.echoices.get_by_label(self.rhs)
+        if self.rhs is None:
+            # Unlike a NULL value, an unknown label matches nothing
+            return self.rhs
+        return super(LabelLookup, self).get_prep_lookup()
 
-def make_echoicefield(echoices, *args, klass_name=None, **kwargs):
+    def as_sql(self, compiler, connection):
+        if self.rhs is None:
+            raise EmptyResultSet
+        return super(LabelLookup, self).as_sql(compiler, connection)
+
+    def get_rhs_op(self, connection, rhs):
+        return connection.operators['exact'] % rhs
+
+
+class _MembersLookup(In):
+    """
+    The member in the field is one of those given by `get_members()`. Resolved to the values of these members.
+
+    """
+
+    def get_prep_lookup(self):
+        self.rhs = self.get_members(self.lhs.output_field.echoices, self.rhs)
+        return super(_MembersLookup, self).get_prep_lookup()
+
+    def get_members(self, echoices, rhs):
+        raise NotImplementedError
+
+
+class LabelInLookup(_MembersLookup):
+    """
+    The label of the member in the field is one of the given ones.
+
+    """
+    lookup_name = 'label_in'
+
+    def get_members(self, echoices, labels):
+        members = [echoices.get_by_label(label) for label in labels]
+        return [m for m in members if m is not None]
+
+
+class MemberInLookup(_MembersLookup):
+    """
+    The member in the field is one of the given EChoice objects, or satisfies the given predicate, a callable taking an
+    EChoice object.
+
+    """
+    lookup_name = 'member_in'
+
+    def get_members(self, echoices, members):
+        if callable(members):
+            return [m for m in echoices if members(m)]
+        return [m if isinstance(m, echoices) else echoices[m] for m in members]
+
+
+for _lookup in (LabelLookup, LabelInLookup, MemberInLookup):
+    EChoiceField.register_lookup(_lookup)
+
+
+def _get_echoicefield_display(instance, field):
+    value = getattr(instance, field.attname)
+    # force_str() to coerce lazy strings.
+    return force_str(field._value2label.get(value, value), strings_only=True)
+
+
+def make_echoicefield(echoices, *args, klass_name=None, coded=False, field_class=None, narrow=False, **kwargs):
     """
     Construct a subclass of a derived `models.Field` specific to the type of the `EChoice` values.
 
@@ -129,9 +389,24 @@ def make_echoicefield(echoices, *args, klass_name=None, **kwargs):
     klass_name : str
         Give a specific name to the returned class.
         By default for Django < 1.9, the name will be 'EChoiceField'.
-        By default for Django >= 1.9, the name will be the name of the enum appended with 'Field'.
+        By default for Django >= 1.9, the name will be the name of the enum appended with 'Field', or with 'CodedField'
+        if `coded`.
+    coded : bool
+        If True, the members are stored as the integer codes declared in the `__codes__` of `echoices`, in a
+        `models.SmallIntegerField`, instead of their values. Mostly intended for `str` values, to save space in large
+        tables and their indexes.
+    field_class : subclass of models.Field
+        Derive from this field instead of the one deduced from the values, e.g. to keep an existing column.
+    narrow : bool
+        If True, integer values are stored in the narrowest integer field supporting all of them, from
+        `models.PositiveSmallIntegerField` to `models.BigIntegerField`, instead of a `models.IntegerField`. As the field
+        then follows the current values, which the migrations are evaluated against, it should be pinned with
+        `field_class` once deployed.
     kwargs
-        Passed to the derived `models.Field`
+        Passed to the derived `models.Field`, and to `EChoiceField`. Pass `check_constraint=True` to restrict an
+        integer column to the stored values with a database CHECK constraint, created along with the column. As the
+        migrations refer to the enum rather than to its values, the constraint of an existing column is not updated
+        when the values change, which must then be done manually.
 
     Returns
     -------
@@ -139,13 +414,26 @@ def make_echoicefield(echoices, *args, klass_name=None, **kwargs):
         For Django>=1.9, the exact name of the returned Field is based on the name of the `echoices` with a suffixed
         'Field'. For older Django, the returned name of the class is `EChoiceField`.
 
+    Raises
+    ------
+    AttributeError
+        if `coded` and `echoices` does not declare any `__codes__`
+    NotImplementedError
+        if `check_constraint` is requested for values which are not stored as integers
+
     """
     assert issubclass(echoices, EChoice)
     value_type = echoices.__getvaluetype__()
-    if value_type is str:
+    template = EChoiceField
+    if coded:
+        if echoices.__codes__ is None:
+            raise AttributeError("{} does not declare any storage codes in __codes__".format(echoices.__name__))
+        template = CodedEChoiceField
+        cls_ = models.SmallIntegerField
+    elif value_type is str:
         cls_ = models.CharField
     elif value_type is int:
-        cls_ = models.IntegerField
+        cls_ = _get_integer_field_class(echoices.values()) if narrow else models.IntegerField
     elif value_type is float:
         cls_ = models.FloatField
     elif value_type is bool:
@@ -153,13 +441,253 @@ def make_echoicefield(echoices, *args, klass_name=None, **kwargs):
     else:
         raise NotImplementedError("Please open an issue if you wish your value type to be supported: "
                                   "https://github.com/mbourqui/django-echoices/issues/new")
-    if klass_name and StrictVersion(django_version()) < StrictVersion('1.9.0'):
+    if kwargs.get('check_constraint') and not coded and value_type is not int:
+        raise NotImplementedError("CHECK constraints are only supported for integer values, not {}".format(value_type))
+    if field_class is not None:
+        assert issubclass(field_class, models.Field)
+        cls_ = field_class
+    if klass_name and _DJANGO_PRE_1_9:
         warnings.warn("Django < 1.9 throws an 'ImportError' if the class name is not defined in the module. "
                       "The provided klass_name will be replaced by {}".format(EChoiceField.__name__), RuntimeWarning)
-    klass_name = EChoiceField.__name__ if StrictVersion(django_version()) < StrictVersion('1.9.0') else \
-        klass_name if klass_name else "{}Field".format(echoices.__name__)
-    d = dict(cls_.__dict__)
-    d.update(dict(EChoiceField.__dict__))
-    return type(klass_name, (cls_,), d)(echoices, *args, **kwargs)
+    klass_name = EChoiceField.__name__ if _DJANGO_PRE_1_9 else \
+        klass_name if klass_name else "{}{}Field".format(echoices.__name__, 'Coded' if coded else '')
+    return _get_field_class(template, echoices, cls_, klass_name)(echoices, *args, **kwargs)
+
+
+def _get_integer_field_class(values):
+    """
+    Return the narrowest integer field supporting all these values, `models.IntegerField` if there is none.
+
+    """
+    if not values:
+        return models.IntegerField
+    lowest, highest = min(values), max(values)
+    for cls_, min_value, max_value in _INTEGER_FIELDS:
+        if min_value <= lowest and highest <= max_value:
+            return cls_
+    raise NotImplementedError("Integer values out of the range of a 64-bit integer: {}".format((lowest, highest)))
+
+
+def _get_field_class(template, echoices, cls_, klass_name):
+    """
+    Return the subclass of `cls_` named `klass_name`, with the methods of `template` and of its bases up to
+    `models.Field`, for the fields of `echoices`. It is created once, then shared by all the fields with the same
+    parameters.
+
+    """
+    key = (template, echoices, cls_, klass_name)
+    try:
+        return _field_classes[key]
+    except KeyError:
+        d = dict(cls_.__dict__)
+        mro = template.__mro__
+        for t in reversed(mro[:mro.index(models.Field)]):
+            d.update(dict(t.__dict__))
+            if 'class_lookups' in t.__dict__:
+                # Merge the lookups, without sharing their dict
+                d['class_lookups'] = dict(d.get('class_lookups', {}), **t.class_lookups)
+        return _field_classes.setdefault(key, type(klass_name, (cls_,), d))
+
+
+class MultipleEChoiceField(models.Field):
+    """
+    Specialized field for multiple choices, stored as a bitmask in a single integer column. Not intended to be called
+    directly but instantiated via `make_multiple_echoicefield()`.
+
+    The value of the field is a `frozenset` of `EChoice` objects. Querying it is supported by the lookups `has`,
+    `has_any` and `has_all`, all computed with bitwise operations by the database.
+
+    Parameters
+    ----------
+    echoices : subclass of EChoice
+        The choices this field supports.
+    * args
+        Are passed to the derived models.Field
+    * kwargs
+        Are passed to the derived models.Field
 
-# TODO: MultipleEChoiceField
+    """
+    description = _("A derived Field supporting multiple enumerated choices")
+
+    def __init__(self, echoices, *args, **kwargs):
+        self.echoices = echoices
+        default = kwargs.get('default')
+        if default is not None and not callable(default):
+            try:
+                kwargs['default'] = self.echoices.to_mask(default)
+            except (KeyError, TypeError):
+                raise AttributeError(
+                    "Illegal default value: {}. Must be an iterable of instances of {}".format(default, self.echoices))
+        super(self.__class__, self).__init__(*args, **kwargs)
+
+    def get_default(self):
+        default = super(self.__class__, self).get_default()
+        if self.has_default():
+            return self.to_python(default)
+        return default
+
+    def from_db_value(self, value, *args):
+        if value is None:
+            return value
+        return self.echoices.from_mask(value)
+
+    def to_python(self, value):
+        if value is None:
+            return value
+        if isinstance(value, self.echoices):
+            return frozenset((value,))
+        try:
+            if isinstance(value, (int, str)):
+                return self.echoices.from_mask(int(value))
+            return frozenset([self._to_member(v) for v in value])
+        except (TypeError, ValueError):
+            raise exceptions.ValidationError(
+                self.error_messages['invalid'],
+                code='invalid',
+                params={'value': value},
+            )
+        except KeyError:
+            raise exceptions.ValidationError(
+                self.error_messages['invalid_choice'],
+                code='invalid_choice',
+                params={'value': value},
+            ) from None
+
+    def _to_member(self, value):
+        if isinstance(value, self.echoices):
+            return value
+        member = self.echoices.get(value)
+        if member is None:
+            # Raises the errors expected by to_python()
+            member = self.echoices[self.echoices.coerce(value)]
+        return member
+
+    def get_prep_value(self, value):
+        if value is None:
+            return value
+        if isinstance(value, int):
+            # Raises a ValueError for the bits not matching any element
+            self.echoices.from_mask(value)
+            return value
+        if isinstance(value, self.echoices):
+            value = (value,)
+        return self.echoices.to_mask(value)
+
+    def value_to_string(self, obj):
+        value = self.get_prep_value(self.value_from_object(obj))
+        # Parsed back by to_python()
+        return None if value is None else str(value)
+
+    def run_validators(self, value):
+        return super(self.__class__, self).run_validators(self.get_prep_value(value))
+
+    def validate(self, value, model_instance):
+        # An empty set is blank
+        return super(self.__class__, self).validate(value if value else '', model_instance)
+
+    def formfield(self, **kwargs):
+        defaults = {'form_class': TypedMultipleEChoiceField, 'echoices': self.echoices}
+        defaults.update(kwargs)
+        # Skip the derived integer field, whose form field and bounds apply to the mask rather than to the choices
+        return models.Field.formfield(self, **defaults)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super(self.__class__, self).deconstruct()
+        kwargs['echoices'] = self.echoices
+        if self.has_default():
+            kwargs['default'] = self.get_default()
+        return name, path, args, kwargs
+
+
+class _BitmaskLookup(models.Lookup):
+    """
+    Compare the bitwise AND of the mask of the field and the one of the given EChoice objects.
+
+    """
+    comparison = None
+
+    def process_rhs(self, compiler, connection):
+        rhs, rhs_params = super(_BitmaskLookup, self).process_rhs(compiler, connection)
+        return rhs, list(rhs_params)
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        masked = connection.ops.combine_expression('&', [lhs, rhs])
+        if self.comparison is None:
+            return '{} = {}'.format(masked, rhs), list(lhs_params) + rhs_params + rhs_params
+        return '{} {}'.format(masked, self.comparison), list(lhs_params) + rhs_params
+
+
+class HasAllLookup(_BitmaskLookup):
+    """
+    All the given EChoice objects are in the field.
+
+    """
+    lookup_name = 'has_all'
+
+
+class HasLookup(HasAllLookup):
+    """
+    The given EChoice object is in the field.
+
+    """
+    lookup_name = 'has'
+
+
+class HasAnyLookup(_BitmaskLookup):
+    """
+    Any of the given EChoice objects is in the field.
+
+    """
+    lookup_name = 'has_any'
+    comparison = '<> 0'
+
+
+for _lookup in (HasLookup, HasAnyLookup, HasAllLookup):
+    MultipleEChoiceField.register_lookup(_lookup)
+
+
+def make_multiple_echoicefield(echoices, *args, klass_name=None, **kwargs):
+    """
+    Construct a subclass of a derived integer `models.Field` storing a set of choices of an `EChoice` as a bitmask.
+
+    Parameters
+    ----------
+    echoices : subclass of EChoice
+    args
+        Passed to the derived `models.Field`
+    klass_name : str
+        Give a specific name to the returned class.
+        By default for Django < 1.9, the name will be 'MultipleEChoiceField'.
+        By default for Django >= 1.9, the name will be the name of the enum appended with 'MultipleField'.
+    kwargs
+        Passed to the derived `models.Field`
+
+    Returns
+    -------
+    MultipleEChoiceField
+        Derived from `models.IntegerField` for up to 31 elements, from `models.BigIntegerField` for up to
+        `MAX_BITMASK_MEMBERS` elements.
+
+    Raises
+    ------
+    NotImplementedError
+        if `echoices` has more than `MAX_BITMASK_MEMBERS` elements
+
+    """
+    assert issubclass(echoices, EChoice)
+    if len(echoices) <= 31:
+        cls_ = models.IntegerField
+    elif len(echoices) <= MAX_BITMASK_MEMBERS:
+        cls_ = models.BigIntegerField
+    else:
+        raise NotImplementedError("Bitmasks are only supported up to {} elements, {} has {}".format(
+            MAX_BITMASK_MEMBERS, echoices.__name__, len(echoices)))
+    if klass_name and _DJANGO_PRE_1_9:
+        warnings.warn("Django < 1.9 throws an 'ImportError' if the class name is not defined in the module. "
+                      "The provided klass_name will be replaced by {}".format(MultipleEChoiceField.__name__),
+                      RuntimeWarning)
+    klass_name = MultipleEChoiceField.__name__ if _DJANGO_PRE_1_9 else \
+        klass_name if klass_name else "{}MultipleField".format(echoices.__name__)
+    return _get_field_class(MultipleEChoiceField, echoices, cls_, klass_name)(echoices, *args, **kwargs)
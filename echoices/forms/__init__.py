@@ -1 +1,2 @@
-from .forms import TypedEChoiceField
+from .forms import TypedEChoiceField, TypedMultipleEChoiceField
+from .widgets import EChoiceSelect
@@ -1,10 +1,214 @@
+from collections.abc import Sequence
+from itertools import chain
+
 from django import forms
+from django.core.exceptions import ValidationError
 
 from echoices.enums import EChoice
+from .widgets import EChoiceSelect
+
+
+class _SharedChoices(Sequence):
+    """
+    Immutable view of the choices of an `EChoice`, preceded by an optional blank choice. Shared by all the copies of a
+    field, which would otherwise copy every choice each time a form is instantiated.
+
+    Parameters
+    ----------
+    choices : tuple
+        As given by `EChoice.choices()`.
+    blank : tuple or None
+        The blank (value, label) choice, if any.
+
+    """
+    __slots__ = ('_choices', '_blank')
+
+    def __init__(self, choices, blank=None):
+        self._choices = choices
+        self._blank = blank
+
+    def __len__(self):
+        return len(self._choices) + (self._blank is not None)
+
+    def __getitem__(self, index):
+        if self._blank is None:
+            return self._choices[index]
+        if isinstance(index, slice) or index < 0:
+            return tuple(self)[index]
+        return self._blank if index == 0 else self._choices[index - 1]
+
+    def __iter__(self):
+        if self._blank is None:
+            return iter(self._choices)
+        return chain((self._blank,), self._choices)
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
 
 class TypedEChoiceField(forms.TypedChoiceField):
+    """
+    Form field for the choices of an `EChoice`.
+
+    Parameters
+    ----------
+    echoices : subclass of EChoice, optional
+        If the choices of this field are those of `echoices`, allows to validate the submitted values with a single
+        lookup, and to render them once for all with an `EChoiceSelect`. Ignored otherwise, e.g. for a subset of them,
+        and reset when the choices are set afterwards.
+    order : str, optional
+        In which the choices of `echoices` are given, see `EOrderedChoice.choices()`.
+    * args
+        Are passed to the `forms.TypedChoiceField`
+    * kwargs
+        Are passed to the `forms.TypedChoiceField`
+
+    """
+
+    widget = EChoiceSelect
+
+    def __init__(self, *args, echoices=None, order=None, **kwargs):
+        self.order = order
+        super(TypedEChoiceField, self).__init__(*args, **kwargs)
+        self.echoices = echoices
+
+    @property
+    def echoices(self):
+        return self._echoices
+
+    @echoices.setter
+    def echoices(self, value):
+        self._echoices = value
+        if value is not None and not self._share_choices():
+            self._echoices = None
+        if isinstance(self.widget, EChoiceSelect):
+            self.widget.echoices = self._echoices
+            self.widget.order = self.order
+
+    def _share_choices(self):
+        """
+        Replace the choices of this field by an immutable view of those of `echoices`, if they are the same.
+
+        Returns
+        -------
+        bool
+            Whether the choices of this field are those of `echoices`.
+
+        """
+        choices = list(self._choices)
+        blank = choices.pop(0) if choices and choices[0][0] in ['', None] else None
+        if self.order is not None:
+            echoices_choices = self.echoices.choices(self.order)
+        else:
+            echoices_choices = self.echoices.choices()
+        if not choices or choices == list(echoices_choices):
+            self._choices = self.widget.choices = _SharedChoices(echoices_choices, blank)
+            return True
+        return False
+
+    def _set_choices(self, value):
+        forms.TypedChoiceField.choices.fset(self, value)
+        self.echoices = None
+
+    choices = property(forms.TypedChoiceField.choices.fget, _set_choices)
+
+    def valid_value(self, value):
+        # A single lookup is only enough if the choices of this field are those of the enum
+        if (self.echoices is not None and isinstance(self._choices, _SharedChoices)
+                and self.echoices.get(value) is not None):
+            return True
+        return super(TypedEChoiceField, self).valid_value(value)
+
     def clean(self, value):
         if isinstance(value, EChoice):
             value = value.value
         return super(TypedEChoiceField, self).clean(value)
+
+
+class TypedMultipleEChoiceField(forms.TypedMultipleChoiceField):
+    """
+    Form field for a set of choices of an `EChoice`. The submitted values are validated and coerced with set
+    operations, and cleaned into a `frozenset` of `EChoice` objects.
+
+    Parameters
+    ----------
+    echoices : subclass of EChoice
+        The choices this field supports. If `choices` is not given, they are those of `echoices`, and the submitted
+        values are looked up directly in its cache. Otherwise, they are validated against the given `choices`.
+    * args
+        Are passed to the `forms.TypedMultipleChoiceField`
+    * kwargs
+        Are passed to the `forms.TypedMultipleChoiceField`
+
+    """
+
+    def __init__(self, echoices, *args, **kwargs):
+        self.echoices = echoices
+        own = 'choices' not in kwargs
+        kwargs.setdefault('choices', echoices.choices())
+        kwargs.setdefault('empty_value', frozenset())
+        super(TypedMultipleEChoiceField, self).__init__(*args, **kwargs)
+        if own:
+            self._str2member = echoices._cache_.str2member
+
+    def _set_choices(self, value):
+        forms.TypedMultipleChoiceField.choices.fset(self, value)
+        self._str2member = None
+
+    choices = property(forms.TypedMultipleChoiceField.choices.fget, _set_choices)
+
+    def _get_str2member(self):
+        """
+        Return the members of the choices of this field, by the string of their value.
+
+        """
+        str2member = self._str2member
+        if str2member is None:
+            values = []
+            for value, label in self.choices:
+                if isinstance(label, (list, tuple)):
+                    # Group of choices
+                    values.extend([v for v, _ in label])
+                else:
+                    values.append(value)
+            own = self.echoices._cache_.str2member
+            str2member = self._str2member = {str(v): own[str(v)] for v in values if str(v) in own}
+        return str2member
+
+    def prepare_value(self, value):
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return [v.value if isinstance(v, EChoice) else v for v in value]
+        return value
+
+    def has_changed(self, initial, data):
+        return super(TypedMultipleEChoiceField, self).has_changed(self.prepare_value(initial), data)
+
+    def validate(self, value):
+        if not value:
+            if self.required:
+                raise ValidationError(self.error_messages['required'], code='required')
+            return
+        invalid = set(value).difference(self._get_str2member())
+        if invalid:
+            raise ValidationError(
+                self.error_messages['invalid_choice'],
+                code='invalid_choice',
+                params={'value': sorted(invalid)[0]},
+            )
+
+    def _coerce(self, value):
+        if value == self.empty_value or value in self.empty_values:
+            return self.empty_value
+        str2member = self._get_str2member()
+        return frozenset([str2member[v] for v in value])
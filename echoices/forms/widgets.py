@@ -0,0 +1,83 @@
+from django import forms
+from django.forms.utils import flatatt
+from django.utils.html import conditional_escape, format_html
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+from echoices.enums import EChoice
+
+# Inserted in the HTML of an option to select it
+_SELECTED = ' selected'
+
+
+class EChoiceSelect(forms.Select):
+    """
+    Select widget for the choices of an `EChoice`, rendering the options without the template engine.
+
+    The HTML of the options is rendered once per enum, order and language, then kept until the translations are
+    reloaded. On each render, it is only patched to select the option of the value. Falls back to the rendering of
+    `forms.Select` if `echoices` is not set, i.e. if the choices are not those of an enum.
+
+    Parameters
+    ----------
+    attrs : dict, optional
+        Are passed to the `forms.Select`
+    choices : iterable, optional
+        Are passed to the `forms.Select`
+    echoices : subclass of EChoice, optional
+        Whose choices are those of this widget, apart from a blank choice.
+    order : str, optional
+        In which the choices are given, see `EOrderedChoice.choices()`.
+
+    """
+
+    def __init__(self, attrs=None, choices=(), echoices=None, order=None):
+        super(EChoiceSelect, self).__init__(attrs, choices)
+        self.echoices = echoices
+        self.order = order
+
+    def render(self, name, value, attrs=None, renderer=None):
+        if self.echoices is None:
+            return super(EChoiceSelect, self).render(name, value, attrs, renderer)
+        html, positions = self._get_options()
+        if isinstance(value, EChoice):
+            value = value.value
+        # Nothing is selected for e.g. an empty list
+        position = positions.get(next(iter(self.format_value(value)), None))
+        if position is not None:
+            html = html[:position] + _SELECTED + html[position:]
+        return format_html('<select name="{}"{}>{}\n</select>', name, flatatt(self.build_attrs(self.attrs, attrs)),
+                           mark_safe(html))
+
+    def _get_options(self):
+        """
+        Return the HTML of the options, with the position at which to select each of them, by the string of its value.
+
+        """
+        blank = None
+        if self.choices and self.choices[0][0] in ['', None]:
+            blank = self.choices[0][1]
+        language = get_language()
+        key = ('EChoiceSelect', self.order, language, blank)
+        return self.echoices._cache_.translated(key, lambda: self._render_options(language, blank))
+
+    def _render_options(self, language, blank):
+        if self.order is not None:
+            choices = self.echoices.choices(self.order, language=language)
+        else:
+            choices = self.echoices.choices(language=language)
+        if blank is not None:
+            choices = (('', blank),) + tuple(choices)
+        html = []
+        positions = {}
+        length = 0
+        for value, label in choices:
+            value = '' if value is None else str(value)
+            # Same markup as forms.Select
+            option = '\n  <option value="{}">{}</option>\n'.format(conditional_escape(value),
+                                                                   conditional_escape(label))
+            # Only the first option of a value is selected, as done by forms.Select
+            positions.setdefault(value, length + option.index('>'))
+            html.append(option)
+            length += len(option)
+        return ''.join(html), positions
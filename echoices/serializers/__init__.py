@@ -0,0 +1 @@
+from .json import EChoiceJSONEncoder, decode_objects, echoice_default, echoice_object_hook
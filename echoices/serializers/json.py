@@ -0,0 +1,117 @@
+from django.core.serializers.json import DjangoJSONEncoder
+
+from echoices.enums import EChoice
+
+
+def echoice_default(o):
+    """
+    Return the value of an EChoice object, to be passed as the `default` parameter of `json.dumps()`.
+
+    Parameters
+    ----------
+    o
+        Object which is not natively serializable.
+
+    Returns
+    -------
+    The value of `o`, if an EChoice object.
+
+    Raises
+    ------
+    TypeError
+        if `o` is not an EChoice object
+
+    """
+    if isinstance(o, EChoice):
+        return o._value_
+    raise TypeError("Object of type {} is not JSON serializable".format(type(o).__name__))
+
+
+class EChoiceJSONEncoder(DjangoJSONEncoder):
+    """
+    JSON encoder serializing the EChoice objects as their values, on top of the types supported by
+    `DjangoJSONEncoder`.
+
+    """
+
+    def default(self, o):
+        if isinstance(o, EChoice):
+            return o._value_
+        return super(EChoiceJSONEncoder, self).default(o)
+
+
+def echoice_object_hook(**echoices):
+    """
+    Return a function decoding the values of the given keys of the JSON objects into EChoice objects, to be passed as
+    the `object_hook` parameter of `json.loads()`.
+
+    The values are looked up in the table of each enum, a list of values being decoded as a whole.
+
+    Parameters
+    ----------
+    echoices
+        Subclass of EChoice, by the key of the objects holding its values.
+
+    Returns
+    -------
+    callable
+
+    Examples
+    --------
+    >>> hook = echoice_object_hook(state=EStates, history=EStates)
+    >>> json.loads('{"state": "c", "history": ["c", "s"]}', object_hook=hook)
+    {'state': <EStates.CREATED: 'c'>, 'history': [<EStates.CREATED: 'c'>, <EStates.SUBMITTED: 's'>]}
+
+    """
+    echoices = list(echoices.items())
+
+    def object_hook(obj):
+        """
+        Raises
+        ------
+        KeyError
+            if a value does not exist in any element
+
+        """
+        for key, echoice in echoices:
+            if key in obj:
+                decode = echoice._cache_.decode
+                value = obj[key]
+                if type(value) is list:
+                    obj[key] = list(map(decode, value))
+                else:
+                    obj[key] = decode(value)
+        return obj
+
+    return object_hook
+
+
+def decode_objects(objects, **echoices):
+    """
+    Decode the values of the given keys of these JSON objects into EChoice objects, in place. Faster than
+    `echoice_object_hook()` for a flat list of objects, as each key is decoded in a single pass over the list.
+
+    Parameters
+    ----------
+    objects : list of dict
+        As loaded by `json.loads()`.
+    echoices
+        Subclass of EChoice, by the key of the objects holding its values.
+
+    Returns
+    -------
+    list of dict
+        `objects`
+
+    Raises
+    ------
+    KeyError
+        if a value does not exist in any element
+
+    """
+    for key, echoice in echoices.items():
+        decode = echoice._cache_.decode
+        for obj in objects:
+            if key in obj:
+                obj[key] = decode(obj[key])
+    return objects
@@ -1,5 +1,11 @@
 from django.contrib import admin
 
-from .models import TestCharChoicesModel
+from echoices.admin import EChoiceListFilter
+from .models import TestCharChoicesModel, TestEChoiceFieldEIntChoicesModel
 
 admin.site.register(TestCharChoicesModel)
+
+
+@admin.register(TestEChoiceFieldEIntChoicesModel)
+class TestEChoiceFieldEIntChoicesModelAdmin(admin.ModelAdmin):
+    list_filter = [('choice', EChoiceListFilter)]
@@ -2,7 +2,7 @@ from django.core import validators
 from django.db import models
 
 from echoices.enums import EChoice, EOrderedChoice, EAutoChoice
-from echoices.fields import make_echoicefield
+from echoices.fields import make_echoicefield, make_multiple_echoicefield
 
 int_validators = (validators.MinValueValidator(-1), validators.MaxValueValidator(100))
 
@@ -20,6 +20,13 @@ class ETestStrChoices(EChoice):
     FIELD2 = ('value2', 'Label 2')
 
 
+class ETestCodedStrChoices(EChoice):
+    __codes__ = {'value1': 1, 'value2': 2, 'retired': 3}
+
+    FIELD1 = ('value1', 'Label 1')
+    FIELD2 = ('value2', 'Label 2')
+
+
 class ETestIntChoices(EChoice):
     FIELD1 = (10, 'Label 1')
     FIELD2 = (20, 'Label 2')
@@ -156,6 +163,10 @@ class TestEChoiceFieldDefaultEIntChoicesModel(models.Model):
     choice = make_echoicefield(ETestIntChoices, default=ETestIntChoices.FIELD1, validators=int_validators)
 
 
+class TestEChoiceFieldCheckEIntChoicesModel(models.Model):
+    choice = make_echoicefield(ETestIntChoices, null=True, check_constraint=True)
+
+
 class TestEChoiceFieldEFloatChoicesModel(models.Model):
     choice = make_echoicefield(ETestFloatChoices, null=True)
 
@@ -180,4 +191,15 @@ class TestEChoiceCharFieldEStrOrderedChoicesSortedModel(models.Model):
 class TestEChoiceCharFieldEStrOrderedChoicesReverseModel(models.Model):
     choice = make_echoicefield(ETestStrOrderedChoices, default=ETestStrOrderedChoices.FIELD1, order='reverse')
 
+
+class TestCodedEChoiceFieldEStrChoicesModel(models.Model):
+    choice = make_echoicefield(ETestCodedStrChoices, coded=True, null=True)
+
+
+# ==========
+# MultipleEChoiceField
+
+class TestMultipleEChoiceFieldEStrChoicesModel(models.Model):
+    choices = make_multiple_echoicefield(ETestStrChoices, blank=True, default=())
+
 # TODO: derive EChoice
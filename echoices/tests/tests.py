@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import copy
 import warnings
 from distutils.version import StrictVersion
 
@@ -11,23 +12,26 @@ from django.db import models
 from django.template import Context, Template
 from django.test import TestCase
 
-from echoices.fields import make_echoicefield
+from echoices.fields import make_echoicefield, make_multiple_echoicefield, trusted_values
 from echoices.tests.models import ETestAutoChoices
 from echoices.tests.models import ETestBoolChoices
-from echoices.tests.models import ETestCharChoices, ETestStrChoices
+from echoices.tests.models import ETestCharChoices, ETestStrChoices, ETestCodedStrChoices
 from echoices.tests.models import ETestCharOrderedChoices, ETestStrOrderedChoices, ETestIntOrderedChoices
 from echoices.tests.models import ETestIntChoices, ETestFloatChoices
 from echoices.tests.models import TestAutoChoicesModel
 from echoices.tests.models import TestBoolChoicesDefaultModel
 from echoices.tests.models import TestCharChoicesDefaultModel, TestStrChoicesDefaultModel, TestIntChoicesDefaultModel
 from echoices.tests.models import TestCharChoicesModel, TestStrChoicesModel, TestIntChoicesModel
+from echoices.tests.models import TestCodedEChoiceFieldEStrChoicesModel
 from echoices.tests.models import TestCharOrderedChoicesModel, TestStrOrderedChoicesModel, TestIntOrderedChoicesModel
 from echoices.tests.models import TestEChoiceCharFieldEStrOrderedChoicesModel
 from echoices.tests.models import TestEChoiceFieldDefaultEBoolChoicesModel
 from echoices.tests.models import TestEChoiceFieldEFloatChoicesModel, TestEChoiceFieldDefaultEFloatChoicesModel
+from echoices.tests.models import TestEChoiceFieldCheckEIntChoicesModel
 from echoices.tests.models import TestEChoiceFieldEIntChoicesModel, TestEChoiceFieldDefaultEIntChoicesModel
 from echoices.tests.models import TestEChoiceFieldEStrChoicesModel, TestEChoiceFieldDefaultEStrChoicesModel
 from echoices.tests.models import TestFloatChoicesModel, TestFloatChoicesDefaultModel
+from echoices.tests.models import TestMultipleEChoiceFieldEStrChoicesModel
 from echoices.tests.models import TestNamedEChoiceFieldEStrChoicesModel
 from echoices.tests.models import int_validators
 from ..tests.models import TestEChoiceCharFieldEStrOrderedChoicesSortedModel, \
@@ -117,6 +121,263 @@ class EChoiceTest(TestCase):
         self.assertIsNone(ETestBoolChoices.get(None))
         self.assertFalse(ETestBoolChoices.get(None, default=False))
 
+    def test_get_str(self):
+        self.assertIs(ETestStrChoices.get('value1'), ETestStrChoices.FIELD1)
+        self.assertIs(ETestIntChoices.get('10'), ETestIntChoices.FIELD1)
+        self.assertIsNone(ETestIntChoices.get('11'))
+        self.assertIsNone(ETestIntChoices.get('foo'))
+        self.assertIs(ETestFloatChoices.get('1.0'), ETestFloatChoices.FIELD1)
+        self.assertIs(ETestFloatChoices.get('2'), ETestFloatChoices.FIELD2)
+        self.assertIs(ETestBoolChoices.get('True'), ETestBoolChoices.FIELD1)
+        self.assertIs(ETestBoolChoices.get('False'), ETestBoolChoices.FIELD2)
+        self.assertIsNone(ETestBoolChoices.get(''))
+
+    def test_decode_many(self):
+        self.assertEqual(ETestCharChoices.decode_many(['u', None, 'v', 'u']),
+                         [ETestCharChoices.FIELD1, None, ETestCharChoices.FIELD2, ETestCharChoices.FIELD1])
+        self.assertEqual(ETestIntChoices.decode_many(iter([20, 10])), [ETestIntChoices.FIELD2, ETestIntChoices.FIELD1])
+        self.assertEqual(ETestIntChoices.decode_many([]), [])
+        self.assertRaises(KeyError, ETestIntChoices.decode_many, [10, 11])
+
+    async def test_adecode_many(self):
+        import asyncio
+        from asgiref.sync import sync_to_async
+
+        self.assertEqual(await ETestIntChoices.adecode_many(iter([20, None, 10]), chunk_size=2),
+                         [ETestIntChoices.FIELD2, None, ETestIntChoices.FIELD1])
+        self.assertEqual(await ETestIntChoices.adecode_many([10, 20], chunk_size=2),
+                         [ETestIntChoices.FIELD1, ETestIntChoices.FIELD2])
+        self.assertEqual(await ETestIntChoices.adecode_many([]), [])
+        with self.assertRaises(KeyError):
+            await ETestIntChoices.adecode_many([10, 11])
+        for chunk_size in [0, -1]:
+            with self.assertRaises(ValueError):
+                await asyncio.wait_for(ETestIntChoices.adecode_many([10], chunk_size=chunk_size), 1)
+
+        # Raw values fetched from the database
+        @sync_to_async
+        def fetch():
+            TestCharChoicesModel.objects.bulk_create([TestCharChoicesModel(choice=v) for v in ['u', 'v', 'u'] * 5])
+            return list(TestCharChoicesModel.objects.order_by('pk').values_list('choice', flat=True))
+
+        # The other coroutines run between the chunks
+        values = await fetch()
+        events = []
+
+        async def rows():
+            for value in values:
+                events.append('row')
+                yield value
+
+        async def tick():
+            for _ in range(3):
+                events.append('tick')
+                await asyncio.sleep(0)
+
+        members, _ = await asyncio.gather(ETestCharChoices.adecode_many(rows(), chunk_size=4), tick())
+        self.assertEqual(members, [ETestCharChoices.FIELD1, ETestCharChoices.FIELD2, ETestCharChoices.FIELD1] * 5)
+        self.assertEqual(events[:10], ['row'] * 4 + ['tick'] + ['row'] * 4 + ['tick'])
+
+    def test_mask(self):
+        self.assertEqual(ETestIntChoices.to_mask([]), 0)
+        self.assertEqual(ETestIntChoices.to_mask([ETestIntChoices.FIELD2]), 2)
+        self.assertEqual(ETestIntChoices.to_mask([ETestIntChoices.FIELD1, 20]), 3)
+        self.assertRaises(KeyError, ETestIntChoices.to_mask, [30])
+        self.assertEqual(ETestIntChoices.from_mask(0), frozenset())
+        self.assertEqual(ETestIntChoices.from_mask(2), frozenset([ETestIntChoices.FIELD2]))
+        self.assertEqual(ETestIntChoices.from_mask(3), frozenset(ETestIntChoices))
+        self.assertRaises(ValueError, ETestIntChoices.from_mask, 4)
+        self.assertRaises(ValueError, ETestIntChoices.from_mask, -1)
+        from ..enums import EChoice
+        ETestManyChoices = EChoice('ETestManyChoices', [('F{}'.format(i), (i, str(i))) for i in range(64)])
+        self.assertRaises(NotImplementedError, ETestManyChoices.to_mask, [0])
+        self.assertRaises(NotImplementedError, ETestManyChoices.from_mask, 1)
+
+    def test_codes(self):
+        self.assertIsNone(ETestStrChoices._cache_.value2code)
+        self.assertEqual(ETestCodedStrChoices._cache_.value2code, {'value1': 1, 'value2': 2})
+        self.assertIs(ETestCodedStrChoices._cache_.code_decoder[2], ETestCodedStrChoices.FIELD2)
+        self.assertIsNone(ETestCodedStrChoices._cache_.code_decoder[None])
+        from ..enums import EChoice
+        for codes in [{'a': 1}, {'a': 1, 'b': 1}, {'a': 1, 'b': 40000}, {'a': 1, 'b': '2'}]:
+            with self.assertRaises(AttributeError):
+                class ETestInvalidCodes(EChoice):
+                    __codes__ = codes
+
+                    A = ('a', 'A')
+                    B = ('b', 'B')
+
+    def test_get_by_label(self):
+        self.assertIs(ETestCharChoices.get_by_label('Label 1'), ETestCharChoices.FIELD1)
+        self.assertIs(ETestIntChoices.get_by_label('Label 2'), ETestIntChoices.FIELD2)
+        self.assertIsNone(ETestCharChoices.get_by_label('foobar'))
+        self.assertTrue(ETestCharChoices.get_by_label('foobar', default=True))
+
+    def test_get_by_label_translated(self):
+        from django.utils import translation
+        from django.utils.translation import gettext_lazy
+        from echoices.enums import EChoice
+
+        for compact in [False, True]:
+            class ETestTranslatedChoices(EChoice, compact=compact):
+                FIELD1 = ('yes', gettext_lazy('Yes'))
+                FIELD2 = ('no', gettext_lazy('No'))
+
+            with translation.override('en'):
+                self.assertIs(ETestTranslatedChoices.get_by_label('Yes'), ETestTranslatedChoices.FIELD1)
+                self.assertIsNone(ETestTranslatedChoices.get_by_label('Oui'))
+            with translation.override('fr'):
+                self.assertIs(ETestTranslatedChoices.get_by_label('Oui'), ETestTranslatedChoices.FIELD1)
+                self.assertIs(ETestTranslatedChoices.get_by_label(ETestTranslatedChoices.FIELD2.label),
+                              ETestTranslatedChoices.FIELD2)
+                self.assertIsNone(ETestTranslatedChoices.get_by_label('Yes'))
+
+    def test_cache(self):
+        self.assertIs(ETestCharChoices.values(), ETestCharChoices.values())
+        self.assertIs(ETestCharChoices.choices(), ETestCharChoices.choices())
+        self.assertIsNot(ETestCharChoices._cache_, ETestStrChoices._cache_)
+        self.assertEqual(ETestCharChoices._cache_.value2member, {'u': ETestCharChoices.FIELD1,
+                                                                 'v': ETestCharChoices.FIELD2})
+        self.assertEqual(ETestCharChoices._cache_.label2member, {'Label 1': ETestCharChoices.FIELD1,
+                                                                 'Label 2': ETestCharChoices.FIELD2})
+        self.assertIsNone(ETestIntChoices._cache_.max_value_length)
+        self.assertRaises(TypeError, ETestIntChoices.max_value_length)
+        from echoices.enums import EChoice
+        self.assertEqual(EChoice.values(), ())
+
+    def test_invalidate(self):
+        cache = ETestStrChoices._cache_
+        ETestStrChoices.invalidate()
+        self.assertIsNot(ETestStrChoices._cache_, cache)
+        self.assertEqual(ETestStrChoices.values(), cache.values)
+        self.assertEqual(ETestStrChoices.choices(), cache.choices)
+        self.assertIs(ETestStrChoices['value1'], ETestStrChoices.FIELD1)
+
+    def test_compact(self):
+        from echoices.enums import EChoice
+
+        class ETestCompactChoices(EChoice, compact=True):
+            FIELD1 = ('u', 'Label 1')
+            FIELD2 = ('v', 'Label 2')
+
+        self.assertTrue(ETestCompactChoices.__compact__)
+        self.assertFalse(ETestCharChoices.__compact__)
+        self.assertEqual(ETestCompactChoices.FIELD1.value, 'u')
+        self.assertEqual(ETestCompactChoices.FIELD1.label, 'Label 1')
+        self.assertEqual(ETestCompactChoices.FIELD1.choice, ('u', 'Label 1'))
+        self.assertIs(ETestCompactChoices.FIELD1.choice, ETestCompactChoices.choices()[0])
+        self.assertEqual(ETestCompactChoices.values(), ('u', 'v'))
+        self.assertEqual(ETestCompactChoices.max_value_length(), 1)
+        self.assertIs(ETestCompactChoices['v'], ETestCompactChoices.FIELD2)
+        self.assertIs(ETestCompactChoices.get('v'), ETestCompactChoices.FIELD2)
+        self.assertIsNone(ETestCompactChoices.get('a'))
+        self.assertIs(ETestCompactChoices.get_by_label('Label 2'), ETestCompactChoices.FIELD2)
+        self.assertIn('u', ETestCompactChoices._cache_.value_set)
+        self.assertNotIn('a', ETestCompactChoices._cache_.value_set)
+        self.assertNotIn('_label_', ETestCompactChoices.FIELD1.__dict__)
+        self.assertEqual(make_echoicefield(ETestCompactChoices).get_prep_value('v'), 'v')
+
+        # Layout of the members overridden by a subclass
+        class ETestCompactBase(EChoice, compact=True):
+            pass
+
+        class ETestDefaultChoices(ETestCompactBase, compact=False):
+            FIELD1 = ('u', 'Label 1')
+
+        self.assertEqual(ETestDefaultChoices.FIELD1.label, 'Label 1')
+        self.assertEqual(ETestDefaultChoices.FIELD1.choice, ('u', 'Label 1'))
+        self.assertNotIn('_choice_', ETestDefaultChoices.FIELD1.__dict__)
+
+    def test_labels(self):
+        from django.test import override_settings
+        from django.utils import translation
+        from django.utils.functional import lazy
+        from echoices.enums import EOrderedChoice
+
+        resolved = []
+
+        def label(text):
+            resolved.append(text)
+            return '{} ({})'.format(text, translation.get_language())
+
+        lazy_label = lazy(label, str)
+
+        class ETestLazyChoices(EOrderedChoice):
+            FIELD1 = ('v', lazy_label('Label 1'))
+            FIELD2 = ('u', lazy_label('Label 2'))
+
+        self.assertEqual(resolved, [])
+        with translation.override('fr'):
+            self.assertEqual(ETestLazyChoices.labels(), ('Label 1 (fr)', 'Label 2 (fr)'))
+        self.assertEqual(ETestLazyChoices.labels('en'), ('Label 1 (en)', 'Label 2 (en)'))
+        self.assertEqual(ETestLazyChoices.choices(language='fr'), (('v', 'Label 1 (fr)'), ('u', 'Label 2 (fr)')))
+        self.assertEqual(ETestLazyChoices.choices('sorted', language='en'),
+                         (('u', 'Label 2 (en)'), ('v', 'Label 1 (en)')))
+        self.assertIs(ETestLazyChoices.choices(language='fr'), ETestLazyChoices.choices(language='fr'))
+        self.assertEqual(len(resolved), 4)
+        # Untranslated choices for the models
+        self.assertIs(ETestLazyChoices.choices(), ETestLazyChoices._cache_.choices)
+        self.assertEqual(len(resolved), 4)
+        # Translations reloaded
+        with override_settings(LANGUAGES=[('en', 'English'), ('fr', 'French')]):
+            self.assertEqual(ETestLazyChoices.labels('fr'), ('Label 1 (fr)', 'Label 2 (fr)'))
+        self.assertEqual(len(resolved), 6)
+        self.assertEqual(ETestCharChoices.labels('fr'), ('Label 1', 'Label 2'))
+
+    def test_cache_read_only(self):
+        cache = ETestCodedStrChoices._cache_
+        for table in (cache.value2member, cache.decoder, cache.str2member, cache.label2member, cache.value2bit,
+                      cache.value2code, cache.code_decoder, cache.comparisons):
+            with self.assertRaises(TypeError):
+                table['value3'] = ETestCodedStrChoices.FIELD1
+        self.assertEqual(dict(cache.value2code), {'value1': 1, 'value2': 2})
+        self.assertIs(cache.decode('value1'), ETestCodedStrChoices.FIELD1)
+
+    def test_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from django.utils import translation
+        from django.utils.functional import lazy
+        from echoices.enums import EOrderedChoice
+        from echoices.enums.enums import clear_translated_labels
+
+        def label(text):
+            return '{} ({})'.format(text, translation.get_language())
+
+        lazy_label = lazy(label, str)
+
+        class ETestThreadedChoices(EOrderedChoice):
+            FIELD1 = ('v', lazy_label('Label 1'))
+            FIELD2 = ('u', lazy_label('Label 2'))
+            FIELD3 = ('w', lazy_label('Label 3'))
+
+        def run(i):
+            language = ('en', 'fr')[i % 2]
+            for _ in range(200):
+                self.assertIs(ETestThreadedChoices['u'], ETestThreadedChoices.FIELD2)
+                self.assertIs(ETestThreadedChoices.get('w'), ETestThreadedChoices.FIELD3)
+                self.assertEqual(ETestThreadedChoices.decode_many(['v', None]), [ETestThreadedChoices.FIELD1, None])
+                self.assertEqual(ETestThreadedChoices.labels(language),
+                                 tuple(['Label {} ({})'.format(n, language) for n in (1, 2, 3)]))
+                self.assertEqual(ETestThreadedChoices.choices('sorted', language=language),
+                                 (('u', 'Label 2 ({})'.format(language)), ('v', 'Label 1 ({})'.format(language)),
+                                  ('w', 'Label 3 ({})'.format(language))))
+                self.assertIs(ETestThreadedChoices.get_by_label(ETestThreadedChoices.FIELD1.label),
+                              ETestThreadedChoices.FIELD1)
+                order = ('sorted', 'reverse', 'natural')[i % 3]
+                self.assertEqual(ETestThreadedChoices.order_by_expression('choice', order),
+                                 ETestThreadedChoices.order_by_expression('choice', order))
+                if i % 4 == 0:
+                    clear_translated_labels()
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            # Re-raise the failures of the threads
+            list(executor.map(run, range(32)))
+        # The stores filled lazily are read-only as well
+        cache = ETestThreadedChoices._cache_
+        for table in (cache._translations[1], cache._order_by_expressions):
+            with self.assertRaises(TypeError):
+                table['key'] = None
+
     def test_coerce(self):
         self.assertEqual(ETestIntChoices.coerce('1'), 1)
         self.assertRaises(TypeError, ETestIntChoices.coerce, None)
@@ -160,6 +421,19 @@ class EChoiceTest(TestCase):
 
         self.assertRaises(TypeError, init_mixed)
 
+    def test_invalid_values_message(self):
+        from echoices.enums import EChoice
+        self.assertRaisesMessage(AttributeError, "Duplicate value: 'u'.", EChoice, 'EDuplicatedChoices',
+                                 [('FIELD1', ('u', 'Label 1')), ('FIELD2', ('v', 'Label 2')),
+                                  ('FIELD3', ('u', 'Label 3'))])
+        self.assertRaisesMessage(TypeError, "Incompatible type: <class 'bool'>. All values must be <class 'int'>.",
+                                 EChoice, 'EMixedChoices', [('FIELD1', (1, 'Label 1')), ('FIELD2', (True, 'Label 2'))])
+
+    def test_value_type(self):
+        self.assertIs(ETestStrChoices.__getvaluetype__(), str)
+        self.assertIs(ETestIntChoices.__getvaluetype__(), int)
+        self.assertIs(ETestAutoChoices.__getvaluetype__(), int)
+
     def test_create_empty_instances(self):
         TestCharChoicesModel.objects.create()
         TestCharChoicesDefaultModel.objects.create()
@@ -264,6 +538,71 @@ class EOrderedChoiceTest(TestCase):
         self.assertTrue(ETestIntOrderedChoices.FIELD3 >= 20)
         self.assertTrue(ETestIntOrderedChoices.FIELD3 >= '20')
 
+    def test_comparison_operands(self):
+        self.assertTrue(ETestIntOrderedChoices.FIELD2 == 10.0)
+        self.assertTrue(ETestIntOrderedChoices.FIELD2 < 10.5)
+        self.assertTrue(ETestIntOrderedChoices.FIELD2 <= ETestIntOrderedChoices.FIELD3)
+        self.assertFalse(ETestIntOrderedChoices.FIELD2 >= ETestIntOrderedChoices.FIELD3)
+        self.assertTrue(ETestIntOrderedChoices.FIELD2 <= '10')
+        self.assertFalse(ETestIntOrderedChoices.FIELD2 >= '11')
+        self.assertFalse(ETestIntOrderedChoices.FIELD2 == 'foo')
+        self.assertTrue(ETestIntOrderedChoices.FIELD2 != None)
+        self.assertTrue(ETestStrOrderedChoices.FIELD2 < 'value2')
+        self.assertFalse(ETestIntOrderedChoices.FIELD2 == ETestStrOrderedChoices.FIELD2)
+        self.assertRaises(TypeError, lambda: ETestIntOrderedChoices.FIELD2 < None)
+        self.assertRaises(TypeError, lambda: ETestIntOrderedChoices.FIELD2 >= None)
+        self.assertRaises(ValueError, lambda: ETestIntOrderedChoices.FIELD2 < 'foo')
+
+    def test_rank(self):
+        self.assertEqual(ETestIntOrderedChoices.FIELD1.rank, 2)
+        self.assertEqual(ETestIntOrderedChoices.FIELD2.rank, 0)
+        self.assertEqual(ETestIntOrderedChoices.FIELD3.rank, 1)
+
+    def test_sort_key(self):
+        members = [ETestIntOrderedChoices.FIELD3, ETestIntOrderedChoices.FIELD1, ETestIntOrderedChoices.FIELD2]
+        self.assertEqual(sorted(members, key=ETestIntOrderedChoices.sort_key()), sorted(members))
+        self.assertEqual(sorted(members, key=ETestIntOrderedChoices.sort_key('reverse')),
+                         sorted(members, reverse=True))
+        self.assertEqual(sorted(members, key=ETestIntOrderedChoices.sort_key('natural')), list(ETestIntOrderedChoices))
+        # Without null values
+        for order in ['sorted', 'reverse', 'natural']:
+            key = ETestIntOrderedChoices.sort_key(order, nullable=False)
+            self.assertEqual(sorted(members, key=key), sorted(members, key=ETestIntOrderedChoices.sort_key(order)))
+        key = ETestIntOrderedChoices.sort_key(nullable=False)
+        self.assertEqual(sorted(members, key=key, reverse=True),
+                         sorted(members, key=ETestIntOrderedChoices.sort_key('reverse')))
+        # Instances of a model, including a null value
+        members = [ETestStrOrderedChoices.FIELD3, None, ETestStrOrderedChoices.FIELD1, ETestStrOrderedChoices.FIELD2]
+        instances = [TestEChoiceCharFieldEStrOrderedChoicesModel(choice=m) for m in members]
+        self.assertEqual([i.choice for i in sorted(instances, key=ETestStrOrderedChoices.sort_key('sorted', 'choice'))],
+                         [None, ETestStrOrderedChoices.FIELD2, ETestStrOrderedChoices.FIELD3,
+                          ETestStrOrderedChoices.FIELD1])
+        instances.pop(1)
+        for order in ['sorted', 'reverse', 'natural']:
+            self.assertEqual(sorted(instances, key=ETestStrOrderedChoices.sort_key(order, 'choice', nullable=False)),
+                             sorted(instances, key=ETestStrOrderedChoices.sort_key(order, 'choice')))
+        self.assertEqual(sorted(members, key=ETestStrOrderedChoices.sort_key('reverse'))[0], None)
+        self.assertEqual(ETestIntOrderedChoices.FIELD3.rank, 1)
+        self.assertNotIn('_rank_', ETestIntOrderedChoices.FIELD3.__dict__)
+        self.assertRaises(AssertionError, ETestIntOrderedChoices.sort_key, 'foobar')
+
+    def test_order_by_expression(self):
+        for member in [ETestIntOrderedChoices.FIELD3, ETestIntOrderedChoices.FIELD1, ETestIntOrderedChoices.FIELD2]:
+            TestIntOrderedChoicesModel.objects.create(choice=member.value)
+        queryset = TestIntOrderedChoicesModel.objects.values_list('choice', flat=True)
+        self.assertEqual(list(queryset.order_by(ETestIntOrderedChoices.order_by_expression('choice'))), [30, 10, 20])
+        self.assertEqual(list(queryset.order_by(ETestIntOrderedChoices.order_by_expression('choice', 'sorted'))),
+                         [10, 20, 30])
+        self.assertEqual(list(queryset.order_by(ETestIntOrderedChoices.order_by_expression('choice', 'reverse'))),
+                         [30, 20, 10])
+        self.assertEqual(list(queryset.order_by(ETestIntOrderedChoices.order_by_expression('choice').desc())),
+                         [20, 10, 30])
+        self.assertIs(ETestIntOrderedChoices.order_by_expression('choice'),
+                      ETestIntOrderedChoices.order_by_expression('choice'))
+        self.assertIsNot(ETestIntOrderedChoices.order_by_expression('choice'),
+                         ETestIntOrderedChoices.order_by_expression('choice', 'sorted'))
+        self.assertRaises(AssertionError, ETestIntOrderedChoices.order_by_expression, 'choice', 'foobar')
+
     def test_create_empty_instances(self):
         TestCharOrderedChoicesModel.objects.create()
         TestStrOrderedChoicesModel.objects.create()
@@ -307,6 +646,13 @@ class ChoiceCharFieldTest(TestCase):
         self.assertTrue(choice.__class__.__bases__[0] is models.CharField)
         self.assertIs(choice.get_internal_type(), models.CharField.__name__)
 
+    def test_make_echoicefield_class(self):
+        choice = make_echoicefield(ETestStrChoices)
+        self.assertIs(choice.__class__, make_echoicefield(ETestStrChoices, default=ETestStrChoices.FIELD1).__class__)
+        self.assertIs(choice.__class__, TestEChoiceFieldEStrChoicesModel._meta.get_field('choice').__class__)
+        self.assertIsNot(choice.__class__, make_echoicefield(ETestStrChoices, klass_name='MyEnumField').__class__)
+        self.assertIsNot(choice.__class__, make_echoicefield(ETestStrOrderedChoices).__class__)
+
     def test_create_empty_instance(self):
         TestEChoiceFieldEStrChoicesModel.objects.create()
         TestNamedEChoiceFieldEStrChoicesModel.objects.create()
@@ -368,6 +714,89 @@ class ChoiceCharFieldTest(TestCase):
         self.assertIs(instance._meta.fields[1].get_default(), ETestStrChoices.FIELD1)
         instance.delete()
 
+    def test_get_prep_value(self):
+        field = make_echoicefield(ETestStrChoices)
+        self.assertEqual(field.get_prep_value(ETestStrChoices.FIELD1), 'value1')
+        self.assertEqual(field.get_prep_value('value2'), 'value2')
+        self.assertIsNone(field.get_prep_value(None))
+        self.assertRaises(AssertionError, field.get_prep_value, 'foo')
+        with trusted_values():
+            self.assertEqual(field.get_prep_value('foo'), 'foo')
+        self.assertRaises(AssertionError, field.get_prep_value, 'foo')
+        field = make_echoicefield(ETestStrChoices, trusted=True)
+        self.assertEqual(field.get_prep_value('foo'), 'foo')
+        # Kept by the copies of the field, e.g. those of the abstract models
+        self.assertIs(field.deconstruct()[3]['trusted'], True)
+        self.assertEqual(field.clone().get_prep_value('foo'), 'foo')
+        self.assertNotIn('trusted', make_echoicefield(ETestStrChoices).deconstruct()[3])
+
+    def test_trusted_values_tasks(self):
+        import asyncio
+
+        field = make_echoicefield(ETestStrChoices)
+        trusted = asyncio.Event()
+        checked = asyncio.Event()
+
+        async def trusting():
+            with trusted_values():
+                trusted.set()
+                await checked.wait()
+                return field.get_prep_value('foo')
+
+        async def checking():
+            await trusted.wait()
+            try:
+                self.assertRaises(AssertionError, field.get_prep_value, 'foo')
+            finally:
+                checked.set()
+
+        async def main():
+            return await asyncio.gather(trusting(), checking())
+
+        self.assertEqual(asyncio.run(main())[0], 'foo')
+
+    def test_flatchoices(self):
+        field = TestEChoiceFieldEStrChoicesModel._meta.get_field('choice')
+        self.assertIs(field.flatchoices, field.flatchoices)
+        field = TestEChoiceCharFieldEStrOrderedChoicesReverseModel._meta.get_field('choice')
+        self.assertEqual(field.flatchoices, [(ETestStrOrderedChoices.FIELD1, 'Label 1'),
+                                             (ETestStrOrderedChoices.FIELD3, 'Label 3'),
+                                             (ETestStrOrderedChoices.FIELD2, 'Label 2')])
+
+    def test_get_display(self):
+        instance = TestEChoiceFieldEStrChoicesModel(choice=ETestStrChoices.FIELD2)
+        self.assertEqual(instance.get_choice_display(), 'Label 2')
+        instance.choice = 'value1'
+        self.assertEqual(instance.get_choice_display(), 'Label 1')
+        instance.choice = None
+        self.assertIsNone(instance.get_choice_display())
+
+    def test_values_list(self):
+        TestEChoiceFieldEStrChoicesModel.objects.create(choice=ETestStrChoices.FIELD2)
+        TestEChoiceFieldEStrChoicesModel.objects.create(choice=ETestStrChoices.FIELD1)
+        self.assertEqual(list(TestEChoiceFieldEStrChoicesModel.objects.order_by('pk').values_list('choice', flat=True)),
+                         [ETestStrChoices.FIELD2, ETestStrChoices.FIELD1])
+
+    def test_lookups(self):
+        TestEChoiceFieldEStrChoicesModel.objects.create(choice=ETestStrChoices.FIELD1)
+        TestEChoiceFieldEStrChoicesModel.objects.create(choice=ETestStrChoices.FIELD2)
+        TestEChoiceFieldEStrChoicesModel.objects.create(choice=ETestStrChoices.FIELD2)
+        qs = TestEChoiceFieldEStrChoicesModel.objects
+        self.assertEqual(qs.filter(choice__label='Label 2').count(), 2)
+        self.assertEqual(qs.filter(choice__label='Label 3').count(), 0)
+        self.assertEqual(qs.exclude(choice__label='Label 3').count(), 3)
+        self.assertEqual(qs.filter(choice__label_in=['Label 1', 'Label 3']).count(), 1)
+        self.assertEqual(qs.filter(choice__label_in=['Label 3']).count(), 0)
+        self.assertEqual(qs.filter(choice__member_in=[ETestStrChoices.FIELD1, 'value2']).count(), 3)
+        self.assertEqual(qs.filter(choice__member_in=lambda m: m.value.endswith('1')).count(), 1)
+        sql = str(qs.filter(choice__label='Label 1').query)
+        self.assertIn('= value1', sql)
+        sql = str(qs.filter(choice__label_in=['Label 1', 'Label 2']).query)
+        self.assertIn('IN (value1, value2)', sql)
+        # Codes
+        TestCodedEChoiceFieldEStrChoicesModel.objects.create(choice=ETestCodedStrChoices.FIELD2)
+        self.assertEqual(TestCodedEChoiceFieldEStrChoicesModel.objects.filter(choice__label='Label 2').count(), 1)
+
     def test_update(self):
         instance = TestEChoiceFieldEStrChoicesModel.objects.create(choice=ETestStrChoices.FIELD1)
         choice = instance.choice
@@ -382,11 +811,110 @@ class ChoiceCharFieldTest(TestCase):
         instance.delete()
 
 
+class ChoiceCodedFieldTest(TestCase):
+    def test_make_echoicefield(self):
+        field = make_echoicefield(ETestCodedStrChoices, coded=True)
+        self.assertIsInstance(field, models.SmallIntegerField)
+        self.assertEqual(field.get_internal_type(), 'SmallIntegerField')
+        self.assertIsNot(field.__class__, make_echoicefield(ETestCodedStrChoices).__class__)
+        self.assertRaises(AttributeError, make_echoicefield, ETestStrChoices, coded=True)
+
+    def test_deconstruct(self):
+        field = make_echoicefield(ETestCodedStrChoices, coded=True, null=True)
+        self.assertEqual(field.__class__.__name__, 'ETestCodedStrChoicesCodedField')
+        name, path, args, kwargs = field.deconstruct()
+        self.assertEqual(path, 'echoices.fields.fields.ETestCodedStrChoicesCodedField')
+        self.assertEqual(kwargs, {'echoices': ETestCodedStrChoices, 'coded': True, 'null': True})
+        # Differs from the plain field, so that switching to the codes is detected by the migrations
+        self.assertNotEqual(make_echoicefield(ETestCodedStrChoices).deconstruct()[1:], (path, args, kwargs))
+        for copied in [field.clone(), make_echoicefield(*args, **kwargs)]:
+            self.assertEqual(copied.get_internal_type(), 'SmallIntegerField')
+            self.assertEqual(copied.get_prep_value('value2'), 2)
+
+    def test_get_prep_value(self):
+        field = make_echoicefield(ETestCodedStrChoices, coded=True)
+        self.assertEqual(field.get_prep_value(ETestCodedStrChoices.FIELD2), 2)
+        self.assertEqual(field.get_prep_value('value1'), 1)
+        self.assertIsNone(field.get_prep_value(None))
+        self.assertRaisesMessage(ValueError, "Invalid value for ETestCodedStrChoices", field.get_prep_value, 'retired')
+
+    def test_create_instance(self):
+        instance = TestCodedEChoiceFieldEStrChoicesModel.objects.create(choice=ETestCodedStrChoices.FIELD2)
+        instance.full_clean()
+        instance.refresh_from_db()
+        self.assertIs(instance.choice, ETestCodedStrChoices.FIELD2)
+        self.assertEqual(TestCodedEChoiceFieldEStrChoicesModel.objects.values_list('choice', flat=True).get(),
+                         ETestCodedStrChoices.FIELD2)
+        self.assertEqual(instance.get_choice_display(), 'Label 2')
+        TestCodedEChoiceFieldEStrChoicesModel.objects.create()
+        self.assertEqual(TestCodedEChoiceFieldEStrChoicesModel.objects.filter(choice='value2').count(), 1)
+        self.assertEqual(TestCodedEChoiceFieldEStrChoicesModel.objects.filter(
+            choice__in=[ETestCodedStrChoices.FIELD1, 'value2']).count(), 1)
+        self.assertEqual(TestCodedEChoiceFieldEStrChoicesModel.objects.filter(choice__isnull=True).count(), 1)
+        from django.db import connection
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT choice FROM {} WHERE id = %s'.format(
+                TestCodedEChoiceFieldEStrChoicesModel._meta.db_table), [instance.pk])
+            self.assertEqual(cursor.fetchone()[0], 2)
+            # Code of a retired value
+            cursor.execute('UPDATE {} SET choice = 3 WHERE id = %s'.format(
+                TestCodedEChoiceFieldEStrChoicesModel._meta.db_table), [instance.pk])
+        with self.assertRaisesMessage(ValueError, 'tests.TestCodedEChoiceFieldEStrChoicesModel.choice: 3'):
+            instance.refresh_from_db()
+
+    def test_formfield(self):
+        field = make_echoicefield(ETestCodedStrChoices, coded=True).formfield()
+        self.assertIs(field.clean('value1'), ETestCodedStrChoices.FIELD1)
+        self.assertRaises(exceptions.ValidationError, field.clean, '1')
+
+
 class ChoiceIntFieldTest(TestCase):
     def test_make_echoicefield(self):
         choice = make_echoicefield(ETestIntChoices, validators=int_validators)
         self.assertTrue(choice.__class__.__bases__[0] is models.IntegerField)
         self.assertIs(choice.get_internal_type(), models.IntegerField.__name__)
+        choice = make_echoicefield(ETestIntChoices, narrow=True)
+        self.assertTrue(choice.__class__.__bases__[0] is models.PositiveSmallIntegerField)
+        choice = make_echoicefield(ETestIntChoices, narrow=True, field_class=models.IntegerField)
+        self.assertTrue(choice.__class__.__bases__[0] is models.IntegerField)
+        self.assertRaises(NotImplementedError, make_echoicefield, ETestStrChoices, check_constraint=True)
+
+    def test_narrowest_field(self):
+        from ..enums import EChoice
+        for values, cls_ in [((0, 32767), models.PositiveSmallIntegerField),
+                             ((-1, 32767), models.SmallIntegerField),
+                             ((0, 32768), models.IntegerField),
+                             ((-2 ** 31, 2 ** 31 - 1), models.IntegerField),
+                             ((0, 2 ** 31), models.BigIntegerField)]:
+            echoices = EChoice('ETestRangeChoices', [('F{}'.format(i), (v, str(v))) for i, v in enumerate(values)])
+            self.assertIs(make_echoicefield(echoices, narrow=True).__class__.__bases__[0], cls_)
+            self.assertIs(make_echoicefield(echoices).__class__.__bases__[0], models.IntegerField)
+
+    def test_check_constraint(self):
+        from django.db import connection, IntegrityError, transaction
+        field = TestEChoiceFieldCheckEIntChoicesModel._meta.get_field('choice')
+        self.assertIn('IN (10, 20)', field.db_parameters(connection)['check'])
+        field = make_echoicefield(ETestAutoChoices, check_constraint=True)
+        field.set_attributes_from_name('choice')
+        self.assertIn('BETWEEN 1 AND 3', field.db_parameters(connection)['check'])
+        # Kept by the copies of the field, e.g. those of the migrations and of the abstract models
+        self.assertIs(field.deconstruct()[3]['check_constraint'], True)
+        field = field.clone()
+        field.set_attributes_from_name('choice')
+        self.assertIn('BETWEEN 1 AND 3', field.db_parameters(connection)['check'])
+        self.assertNotIn('check_constraint', make_echoicefield(ETestAutoChoices).deconstruct()[3])
+        # Created by the migrations
+        from django.db.migrations.state import ModelState, ProjectState
+        state = ProjectState()
+        state.add_model(ModelState.from_model(TestEChoiceFieldCheckEIntChoicesModel))
+        model = state.apps.get_model(TestEChoiceFieldCheckEIntChoicesModel._meta.label)
+        sql, _ = connection.schema_editor().table_sql(model)
+        self.assertIn('CHECK ({} IN (10, 20))'.format(connection.ops.quote_name('choice')), sql)
+        TestEChoiceFieldCheckEIntChoicesModel.objects.create(choice=ETestIntChoices.FIELD2)
+        TestEChoiceFieldCheckEIntChoicesModel.objects.create()
+        with trusted_values():
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                TestEChoiceFieldCheckEIntChoicesModel.objects.create(choice=30)
 
     def validate_instance(self, instance):
         choice = instance.choice
@@ -405,6 +933,14 @@ class ChoiceIntFieldTest(TestCase):
         # to_python()
         self.assertRaisesRegexp(exceptions.ValidationError, r"^\[.+foo.+ value must be an integer\..\]$",
                                  instance._meta.fields[1].to_python, 'foo')
+        self.assertIs(instance._meta.fields[1].to_python('10'), ETestIntChoices.FIELD1)
+        self.assertIs(instance._meta.fields[1].to_python(' 20'), ETestIntChoices.FIELD2)
+        with self.assertRaises(exceptions.ValidationError) as cm:
+            instance._meta.fields[1].to_python('30')
+        self.assertEqual(cm.exception.code, 'invalid_choice')
+        with self.assertRaises(exceptions.ValidationError) as cm:
+            instance._meta.fields[1].to_python('foo')
+        self.assertEqual(cm.exception.code, 'invalid')
         # Custom flatchoices
         self.assertEqual(instance._meta.fields[1].flatchoices,
                          [(ETestIntChoices.FIELD1, 'Label 1'), (ETestIntChoices.FIELD2, 'Label 2')])
@@ -432,6 +968,31 @@ class ChoiceIntFieldTest(TestCase):
         instance.save()
         instance.delete()
 
+    def test_validate(self):
+        from django.core import validators
+        field = make_echoicefield(ETestIntChoices, validators=[validators.MaxValueValidator(15)])
+        field.set_attributes_from_name('choice')
+        self.assertIs(field.clean(ETestIntChoices.FIELD1, None), ETestIntChoices.FIELD1)
+        self.assertIs(field.clean(10, None), ETestIntChoices.FIELD1)
+        # Validators of the field are still run
+        with self.assertRaises(exceptions.ValidationError) as cm:
+            field.clean(ETestIntChoices.FIELD2, None)
+        self.assertEqual(cm.exception.error_list[0].code, 'max_value')
+        # Null
+        with self.assertRaises(exceptions.ValidationError) as cm:
+            field.clean(None, None)
+        self.assertEqual(cm.exception.error_list[0].code, 'null')
+        field = make_echoicefield(ETestIntChoices, null=True, blank=True, validators=int_validators)
+        self.assertIsNone(field.clean(None, None))
+        field.run_validators(None)
+        # Validators of the derived field are skipped when all the members pass them
+        field = make_echoicefield(ETestStrChoices)
+        self.assertTrue(any([isinstance(v, validators.MaxLengthValidator) for v in field.validators]))
+        self.assertEqual(field._member_validators, [])
+        field = make_echoicefield(ETestIntChoices, field_class=models.PositiveSmallIntegerField,
+                                  validators=int_validators)
+        self.assertEqual(field._member_validators, list(int_validators))
+
     def test_create_instance_default(self):
         instance = TestEChoiceFieldDefaultEIntChoicesModel.objects.create()
         choice = instance.choice
@@ -535,6 +1096,8 @@ class ChoiceBoolFieldTest(TestCase):
         self.assertIs(instance._meta.fields[1].get_default(), ETestBoolChoices.FIELD1)
         # to_python()
         self.assertTrue(instance._meta.fields[1].to_python('foo'))
+        self.assertIs(instance._meta.fields[1].to_python('True'), ETestBoolChoices.FIELD1)
+        self.assertIs(instance._meta.fields[1].to_python('False'), ETestBoolChoices.FIELD2)
         # Custom flatchoices
         self.assertEqual(instance._meta.fields[1].flatchoices,
                          [(ETestBoolChoices.FIELD1, 'Label 1'), (ETestBoolChoices.FIELD2, 'Label 2')])
@@ -672,6 +1235,145 @@ class AdminTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertInHTML('<option value="u" selected="selected">Label 1</option>', response.rendered_content)
 
+    def test_echoicelistfilter(self):
+        from django.core.cache import cache
+        cache.clear()
+        TestEChoiceFieldEIntChoicesModel.objects.create(choice=ETestIntChoices.FIELD1)
+        TestEChoiceFieldEIntChoicesModel.objects.create(choice=ETestIntChoices.FIELD1)
+        TestEChoiceFieldEIntChoicesModel.objects.create()
+        url = '/admin/tests/testechoicefieldeintchoicesmodel/'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        content = response.rendered_content
+        self.assertIn('Label 1 (2)', content)
+        self.assertIn('Label 2 (0)', content)
+        self.assertIn('- (1)', content)
+        # Cached
+        TestEChoiceFieldEIntChoicesModel.objects.create(choice=ETestIntChoices.FIELD2)
+        self.assertIn('Label 2 (0)', self.client.get(url).rendered_content)
+        cache.clear()
+        response = self.client.get(url + '?choice__exact=20')
+        self.assertInHTML('<p class="paginator">1 test e choice field e int choices model</p>',
+                          response.rendered_content)
+        self.assertIn('Label 2 (1)', response.rendered_content)
+        response = self.client.get(url + '?choice__isnull=True')
+        self.assertInHTML('<p class="paginator">1 test e choice field e int choices model</p>',
+                          response.rendered_content)
+        # Invalid choice
+        response = self.client.get(url + '?choice__exact=30')
+        self.assertRedirects(response, url + '?e=1', fetch_redirect_response=False)
+
+    def test_echoicelistfilter_single_query(self):
+        from django.contrib import admin
+        from django.core.cache import cache
+        from django.test import RequestFactory
+        from echoices.admin import EChoiceListFilter
+        cache.clear()
+        TestEChoiceFieldEIntChoicesModel.objects.create(choice=ETestIntChoices.FIELD2)
+        field = TestEChoiceFieldEIntChoicesModel._meta.get_field('choice')
+        model_admin = admin.site._registry[TestEChoiceFieldEIntChoicesModel]
+        list_filter = EChoiceListFilter(field, RequestFactory().get('/'), {}, TestEChoiceFieldEIntChoicesModel,
+                                        model_admin, 'choice')
+        with self.assertNumQueries(1):
+            counts = list_filter.get_counts(TestEChoiceFieldEIntChoicesModel.objects.all())
+        self.assertEqual(counts, {10: 0, 20: 1, None: 0})
+        with self.assertNumQueries(0):
+            list_filter.get_counts(TestEChoiceFieldEIntChoicesModel.objects.all())
+        with self.assertNumQueries(0):
+            counts = list_filter.get_counts(TestEChoiceFieldEIntChoicesModel.objects.none())
+        self.assertEqual(counts, {10: 0, 20: 0, None: 0})
+
+
+class MultipleChoiceFieldTest(TestCase):
+    def test_make_multiple_echoicefield(self):
+        field = make_multiple_echoicefield(ETestStrChoices)
+        self.assertEqual(field.__class__.__name__, 'ETestStrChoicesMultipleField')
+        self.assertIsInstance(field, models.IntegerField)
+        self.assertIs(field.__class__, make_multiple_echoicefield(ETestStrChoices).__class__)
+        self.assertIsNot(field.__class__, make_echoicefield(ETestStrChoices).__class__)
+        from ..enums import EChoice
+        ETestManyChoices = EChoice('ETestManyChoices', [('F{}'.format(i), (i, str(i))) for i in range(40)])
+        self.assertIsInstance(make_multiple_echoicefield(ETestManyChoices), models.BigIntegerField)
+        self.assertRaises(AttributeError, make_multiple_echoicefield, ETestStrChoices, default=['value3'])
+
+    def test_create_instance(self):
+        instance = TestMultipleEChoiceFieldEStrChoicesModel.objects.create()
+        self.assertEqual(instance.choices, frozenset())
+        instance.choices = [ETestStrChoices.FIELD2]
+        instance.save()
+        instance.refresh_from_db()
+        self.assertEqual(instance.choices, frozenset([ETestStrChoices.FIELD2]))
+        instance.choices = frozenset(ETestStrChoices)
+        instance.full_clean()
+        instance.save()
+        instance.refresh_from_db()
+        self.assertEqual(instance.choices, frozenset(ETestStrChoices))
+        # Members given as a list, a set or alone
+        for choices in [[ETestStrChoices.FIELD1], {ETestStrChoices.FIELD1, ETestStrChoices.FIELD2},
+                        ETestStrChoices.FIELD2]:
+            instance.choices = choices
+            instance.full_clean()
+        self.assertEqual(instance.choices, frozenset([ETestStrChoices.FIELD2]))
+
+    def test_to_python(self):
+        field = TestMultipleEChoiceFieldEStrChoicesModel._meta.get_field('choices')
+        self.assertEqual(field.to_python(['value1']), frozenset([ETestStrChoices.FIELD1]))
+        self.assertEqual(field.to_python([ETestStrChoices.FIELD1, 'value2']), frozenset(ETestStrChoices))
+        self.assertEqual(field.to_python(ETestStrChoices.FIELD2), frozenset([ETestStrChoices.FIELD2]))
+        self.assertEqual(field.to_python('2'), frozenset([ETestStrChoices.FIELD2]))
+        with self.assertRaises(exceptions.ValidationError) as cm:
+            field.to_python(['value3'])
+        self.assertEqual(cm.exception.code, 'invalid_choice')
+        with self.assertRaises(exceptions.ValidationError) as cm:
+            field.to_python(8)
+        self.assertEqual(cm.exception.code, 'invalid')
+
+    def test_lookups(self):
+        TestMultipleEChoiceFieldEStrChoicesModel.objects.create(choices=[ETestStrChoices.FIELD1])
+        TestMultipleEChoiceFieldEStrChoicesModel.objects.create(choices=[ETestStrChoices.FIELD2])
+        TestMultipleEChoiceFieldEStrChoicesModel.objects.create(choices=ETestStrChoices)
+        TestMultipleEChoiceFieldEStrChoicesModel.objects.create()
+        qs = TestMultipleEChoiceFieldEStrChoicesModel.objects
+        self.assertEqual(qs.filter(choices__has=ETestStrChoices.FIELD1).count(), 2)
+        self.assertEqual(qs.filter(choices__has_any=ETestStrChoices).count(), 3)
+        self.assertEqual(qs.filter(choices__has_all=ETestStrChoices).count(), 1)
+        self.assertEqual(qs.filter(choices=[]).count(), 1)
+        self.assertEqual(qs.filter(choices=3).count(), 1)
+        self.assertRaises(ValueError, qs.filter, choices=8)
+
+    def test_serialize(self):
+        from django.core import serializers
+
+        instance = TestMultipleEChoiceFieldEStrChoicesModel.objects.create(choices=ETestStrChoices)
+        for format in ['xml', 'json']:
+            data = serializers.serialize(format, [instance])
+            deserialized = next(serializers.deserialize(format, data)).object
+            self.assertEqual(deserialized.choices, frozenset(ETestStrChoices))
+
+    def test_formfield(self):
+        field = make_multiple_echoicefield(ETestStrChoices).formfield()
+        self.assertEqual(field.clean(['value1', 'value2']), frozenset(ETestStrChoices))
+        with self.assertRaises(exceptions.ValidationError) as cm:
+            field.clean(['value1', 'value3'])
+        self.assertEqual(cm.exception.code, 'invalid_choice')
+        with self.assertRaises(exceptions.ValidationError) as cm:
+            field.clean([])
+        self.assertEqual(cm.exception.code, 'required')
+        field = make_multiple_echoicefield(ETestStrChoices, blank=True).formfield()
+        self.assertEqual(field.clean([]), frozenset())
+        self.assertFalse(field.has_changed(frozenset([ETestStrChoices.FIELD1]), ['value1']))
+        # Subset of the choices
+        from echoices.forms import TypedMultipleEChoiceField
+        field = TypedMultipleEChoiceField(ETestStrChoices, choices=[('value1', 'L1')])
+        self.assertEqual(field.clean(['value1']), frozenset([ETestStrChoices.FIELD1]))
+        with self.assertRaises(exceptions.ValidationError) as cm:
+            field.clean(['value2'])
+        self.assertEqual(cm.exception.code, 'invalid_choice')
+        field = make_multiple_echoicefield(ETestStrChoices).formfield()
+        field.choices = [('Group', [('value2', 'L2')])]
+        self.assertEqual(field.clean(['value2']), frozenset([ETestStrChoices.FIELD2]))
+        self.assertRaises(exceptions.ValidationError, field.clean, ['value1'])
+
 
 class FormTest(TestCase):
     def test_form(self):
@@ -688,6 +1390,102 @@ class FormTest(TestCase):
         f = SimpleForm(dict(choice=''))
         self.assertFalse(f.is_valid())
 
+    def test_form_echoices(self):
+        from echoices.forms import TypedEChoiceField
+        field = make_echoicefield(ETestIntChoices).formfield()
+        self.assertIs(field.echoices, ETestIntChoices)
+        self.assertIs(field.clean('10'), ETestIntChoices.FIELD1)
+        self.assertIs(field.clean(ETestIntChoices.FIELD2), ETestIntChoices.FIELD2)
+        with self.assertRaises(exceptions.ValidationError) as cm:
+            field.clean('30')
+        self.assertEqual(cm.exception.code, 'invalid_choice')
+        with self.assertRaises(exceptions.ValidationError) as cm:
+            field.clean('')
+        self.assertEqual(cm.exception.code, 'required')
+        # Custom choices
+        field.choices = [ETestIntChoices.FIELD1.choice]
+        self.assertIsNone(field.echoices)
+        self.assertIs(field.clean('10'), ETestIntChoices.FIELD1)
+        self.assertRaises(exceptions.ValidationError, field.clean, '20')
+        field = make_echoicefield(ETestIntChoices).formfield(choices=[ETestIntChoices.FIELD1.choice])
+        self.assertIsNone(field.echoices)
+        field = TypedEChoiceField(choices=[ETestIntChoices.FIELD1.choice], coerce=ETestIntChoices.get,
+                                  echoices=ETestIntChoices)
+        self.assertIs(field.clean('10'), ETestIntChoices.FIELD1)
+        self.assertFalse(field.valid_value('20'))
+        self.assertRaises(exceptions.ValidationError, field.clean, '20')
+
+    def test_echoiceselect(self):
+        from echoices.forms import EChoiceSelect
+        field = make_echoicefield(ETestIntChoices, blank=True).formfield()
+        self.assertIsInstance(field.widget, EChoiceSelect)
+        self.assertIs(field.widget.echoices, ETestIntChoices)
+        select = forms.Select(choices=field.choices)
+        for value in [None, '', 10, '20', 30]:
+            self.assertHTMLEqual(field.widget.render('choice', value, {'id': 'id_choice', 'required': True}),
+                                 select.render('choice', value, {'id': 'id_choice', 'required': True}))
+        self.assertEqual(field.widget.render('choice', 10), select.render('choice', 10))
+        self.assertEqual(field.widget.render('choice', ETestIntChoices.FIELD2), select.render('choice', 20))
+        self.assertEqual(field.widget.render('choice', []), select.render('choice', []))
+        # Ordered
+        field = make_echoicefield(ETestStrOrderedChoices, order='sorted').formfield()
+        self.assertEqual(field.widget.order, 'sorted')
+        self.assertEqual(field.widget.render('choice', 'value2'),
+                         forms.Select(choices=field.choices).render('choice', 'value2'))
+        # Copied with the form
+        copied = copy.deepcopy(field)
+        self.assertIs(copied.widget.echoices, ETestStrOrderedChoices)
+        # Custom choices
+        field.choices = [ETestStrOrderedChoices.FIELD1.choice]
+        self.assertIsNone(field.widget.echoices)
+        self.assertEqual(field.widget.render('choice', 'value3'),
+                         forms.Select(choices=field.choices).render('choice', 'value3'))
+
+    def test_shared_choices(self):
+        field = make_echoicefield(ETestIntChoices, blank=True).formfield()
+        self.assertEqual(field.choices, [('', '---------'), (10, 'Label 1'), (20, 'Label 2')])
+        self.assertEqual(len(field.choices), 3)
+        self.assertEqual(field.choices[1], (10, 'Label 1'))
+        self.assertEqual(field.choices[-1], (20, 'Label 2'))
+        self.assertIs(copy.deepcopy(field).choices, field.choices)
+        self.assertIs(copy.deepcopy(field).widget.choices, field.choices)
+
+        class SimpleForm(forms.Form):
+            choice = make_echoicefield(ETestStrOrderedChoices, order='reverse').formfield()
+
+        self.assertEqual(SimpleForm.base_fields['choice'].choices[1:], ETestStrOrderedChoices.choices('reverse'))
+        self.assertIs(SimpleForm().fields['choice'].choices, SimpleForm().fields['choice'].choices)
+        # Other choices than those of the enum
+        field = make_echoicefield(ETestIntChoices).formfield()
+        field.choices = [ETestIntChoices.FIELD1.choice]
+        self.assertIsNot(copy.deepcopy(field).choices, field.choices)
+        field = make_echoicefield(ETestIntChoices).formfield(choices=[ETestIntChoices.FIELD1.choice])
+        field.echoices = ETestIntChoices
+        self.assertEqual(field.choices, [ETestIntChoices.FIELD1.choice])
+        self.assertIsNot(copy.deepcopy(field).choices, field.choices)
+        self.assertIsNone(field.echoices)
+        self.assertIsNone(field.widget.echoices)
+        self.assertTrue(field.valid_value(10))
+        self.assertFalse(field.valid_value(20))
+        self.assertEqual(field.clean('10'), ETestIntChoices.FIELD1)
+        with self.assertRaises(exceptions.ValidationError):
+            field.clean('20')
+        self.assertNotIn('value="20"', field.widget.render('choice', 10))
+
+    def test_echoiceselect_translations(self):
+        from django.utils import translation
+        from django.utils.translation import gettext_lazy
+        from ..enums import EChoice
+
+        class ETestTranslatedChoices(EChoice):
+            FIELD1 = ('yes', gettext_lazy('Yes'))
+
+        field = make_echoicefield(ETestTranslatedChoices).formfield()
+        with translation.override('en'):
+            self.assertInHTML('<option value="yes">Yes</option>', field.widget.render('choice', None))
+        with translation.override('fr'):
+            self.assertInHTML('<option value="yes" selected>Oui</option>', field.widget.render('choice', 'yes'))
+
     def test_modelform_testcharchoicesmodel(self):
         from django.forms import ModelForm
 
@@ -724,3 +1522,137 @@ class SerializationTestCase(TestCase):
         pickle.loads(pickle.dumps(EOrderedChoice))
         from ..enums import EAutoChoice
         pickle.loads(pickle.dumps(EAutoChoice))
+
+    def test_pickle_members(self):
+        import pickle
+        for echoice in [ETestCharChoices, ETestIntChoices, ETestFloatChoices, ETestBoolChoices, ETestIntOrderedChoices,
+                        ETestAutoChoices]:
+            for member in echoice:
+                for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                    self.assertIs(pickle.loads(pickle.dumps(member, protocol)), member)
+        members = [ETestStrChoices.FIELD1, ETestStrChoices.FIELD2] * 10
+        self.assertEqual(pickle.loads(pickle.dumps(members)), members)
+        self.assertEqual(ETestStrChoices.FIELD1.__reduce_ex__(4), (ETestStrChoices, ('value1',)))
+        self.assertIs(ETestStrChoices('value2'), ETestStrChoices.FIELD2)
+        self.assertRaises(ValueError, ETestStrChoices, 'value3')
+        self.assertRaises(ValueError, ETestStrChoices, ['value1'])
+
+    def test_json(self):
+        import json
+        from datetime import date
+        from echoices.serializers import EChoiceJSONEncoder, decode_objects, echoice_default, echoice_object_hook
+        payload = {'choice': ETestIntChoices.FIELD1, 'choices': [ETestStrChoices.FIELD2, ETestStrChoices.FIELD1],
+                   'other': None}
+        dumped = json.dumps(payload, default=echoice_default)
+        self.assertEqual(json.loads(dumped), {'choice': 10, 'choices': ['value2', 'value1'], 'other': None})
+        self.assertEqual(json.dumps(payload, cls=EChoiceJSONEncoder), dumped)
+        self.assertEqual(json.dumps([date(2020, 1, 2), ETestBoolChoices.FIELD2], cls=EChoiceJSONEncoder),
+                         '["2020-01-02", false]')
+        self.assertRaises(TypeError, json.dumps, [date(2020, 1, 2)], default=echoice_default)
+        loaded = json.loads(dumped, object_hook=echoice_object_hook(choice=ETestIntChoices, choices=ETestStrChoices,
+                                                                    other=ETestIntChoices))
+        self.assertEqual(loaded, payload)
+        self.assertIs(loaded['choice'], ETestIntChoices.FIELD1)
+        self.assertRaises(KeyError, json.loads, '{"choice": 30}',
+                          object_hook=echoice_object_hook(choice=ETestIntChoices))
+        self.assertEqual(decode_objects(json.loads('[{"choice": 20}, {"choice": null}, {}]'), choice=ETestIntChoices),
+                         [{'choice': ETestIntChoices.FIELD2}, {'choice': None}, {}])
+
+
+def _shared_labels(shared, values):
+    labels = [shared.label(value) for value in values]
+    echoice = shared.echoice
+    return echoice.__name__, labels, [echoice[value].label for value in values]
+
+
+class SharedEChoiceTest(TestCase):
+    def test_create(self):
+        import pickle
+        from echoices.enums import EOrderedChoice, SharedEChoice
+
+        shared = SharedEChoice.create(ETestStrOrderedChoices)
+        try:
+            self.assertIs(shared.base, EOrderedChoice)
+            attached = pickle.loads(pickle.dumps(shared))
+            self.assertIsNone(attached._members)
+            self.assertEqual(attached.choices, ETestStrOrderedChoices.choices())
+            # Served without materializing the members
+            self.assertEqual(attached.label('value2'), 'Label 3')
+            self.assertIsNone(attached.label('foo'))
+            self.assertIn('value3', attached)
+            self.assertNotIn('foo', attached)
+            self.assertIsNone(attached._echoice)
+            echoice = attached.echoice
+            self.assertIs(echoice, attached.echoice)
+            self.assertTrue(issubclass(echoice, EOrderedChoice))
+            self.assertTrue(echoice.__compact__)
+            self.assertEqual(echoice.__name__, 'ETestStrOrderedChoices')
+            self.assertEqual([m.name for m in echoice], [m.name for m in ETestStrOrderedChoices])
+            self.assertEqual(echoice.choices('sorted'), ETestStrOrderedChoices.choices('sorted'))
+            # Usable as any other EChoice
+            self.assertEqual(echoice.decode_many(['value3', None]), [echoice.FIELD1, None])
+            self.assertIs(make_echoicefield(echoice).to_python('value2'), echoice.FIELD3)
+            self.assertRaises(AssertionError, attached.unlink)
+        finally:
+            shared.unlink()
+
+    def test_auto(self):
+        from echoices.enums import SharedEChoice
+
+        shared = SharedEChoice.create(ETestAutoChoices, compact=False)
+        try:
+            echoice = shared.echoice
+            self.assertFalse(echoice.__compact__)
+            self.assertEqual(echoice.choices(), ETestAutoChoices.choices())
+        finally:
+            shared.unlink()
+
+    def test_invalid(self):
+        from decimal import Decimal
+        from django.utils.functional import lazy
+        from echoices.enums import EChoice, SharedEChoice
+
+        class ETestLazyChoices(EChoice):
+            FIELD1 = ('u', lazy(str, str)('Label 1'))
+
+        class ETestDecimalChoices(EChoice):
+            FIELD1 = (Decimal('1.5'), 'Label 1')
+
+        self.assertRaises(TypeError, SharedEChoice.create, ETestLazyChoices)
+        self.assertRaises(TypeError, SharedEChoice.create, ETestDecimalChoices)
+
+    def test_processes(self):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from echoices.enums import SharedEChoice
+
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            self.skipTest("The workers require the fork start method to find the settings.")
+        shared = SharedEChoice.create(ETestIntChoices)
+        try:
+            with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('fork')) as executor:
+                results = list(executor.map(_shared_labels, [shared] * 2, [[10, 20], [20]]))
+        finally:
+            shared.unlink()
+        self.assertEqual(results, [('ETestIntChoices', ['Label 1', 'Label 2'], ['Label 1', 'Label 2']),
+                                   ('ETestIntChoices', ['Label 2'], ['Label 2'])])
+
+    def test_lifetime(self):
+        import os
+        import pickle
+        import subprocess
+        import sys
+        from echoices.enums import SharedEChoice
+
+        shared = SharedEChoice.create(ETestIntChoices)
+        try:
+            # A process with its own resource tracker, which would unlink the blocks registered to it when exiting
+            script = 'import pickle, sys; print(pickle.loads(bytes.fromhex(sys.argv[1])).choices)'
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+            output = subprocess.run([sys.executable, '-c', script, pickle.dumps(shared).hex()], env=env,
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+            self.assertEqual(output.stdout.decode().strip(), repr(ETestIntChoices.choices()))
+            self.assertEqual(output.stderr, b'')
+            self.assertEqual(pickle.loads(pickle.dumps(shared)).choices, ETestIntChoices.choices())
+        finally:
+            shared.unlink()